@@ -3,16 +3,39 @@
 Analyze Granola meeting notes and categorize them.
 """
 
+import io
 import os
 import re
 import json
+import functools
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import chain
+
+# Optional orjson (C extension) for the meetings_analysis.json round trip
+try:
+    import orjson
+    ORJSON_ENABLED = True
+except ImportError:
+    orjson = None
+    ORJSON_ENABLED = False
+
+# Optional Aho-Corasick automaton (pyahocorasick) for single-pass name detection
+try:
+    import ahocorasick
+    AHOCORASICK_ENABLED = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_ENABLED = False
 
 VAULT_PATH = Path("/home/Arnab/clawd/projects/career-agent/obsidian/vault")
 OUTPUT_PATH = Path("/home/Arnab/clawd/projects/career-agent/analysis")
 
+# Files per task sent to the extraction process pool (amortizes IPC)
+FILE_CHUNKSIZE = 8
+
 # Patterns to identify meeting types
 PATTERNS = {
     "1on1": [
@@ -64,6 +87,75 @@ KNOWN_PEOPLE = set([
     "Muni", "Muniraju", "Rajat", "Rittik", "Suchit", "Nobal"
 ])
 
+# Precompiled once at import; the per-meeting helpers below run these many times
+COMPILED_PATTERNS = {
+    category: [re.compile(p, re.IGNORECASE) for p in patterns]
+    for category, patterns in PATTERNS.items()
+}
+
+# One alternation per category so categorize_meeting scans each title once per category
+CATEGORY_REGEX = {
+    category: re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    for category, patterns in PATTERNS.items()
+}
+
+# Meeting headers and their metadata fields in one pass; group names match meeting keys
+SECTION_RX = re.compile(
+    r'(?P<header>^## (?!Granola Notes)(?P<title>.+?)$)'
+    r'|\*\*Granola ID:\*\* (?P<granola_id>[a-f0-9-]+)'
+    r'|\*\*Created:\*\* (?P<created>[^\n]+)'
+    r'|(?P<transcript_link>https://notes\.granola\.ai/t/[a-f0-9-]+)',
+    re.MULTILINE
+)
+
+PERSON_SUFFIX_RE = re.compile(r'\s*[-–]\s*\d+.*$')
+PERSON_ARROWS_RE = re.compile(r'\s*<>.*$')
+# Lowercased name -> name for the token-set fallback; \w+ tokens mirror \b boundaries
+KNOWN_PEOPLE_LC = {p.lower(): p for p in KNOWN_PEOPLE}
+TOKEN_RX = re.compile(r'\w+')
+
+if AHOCORASICK_ENABLED:
+    PEOPLE_AC = ahocorasick.Automaton()
+    for _person in KNOWN_PEOPLE:
+        PEOPLE_AC.add_word(_person.lower(), _person)
+    PEOPLE_AC.make_automaton()
+else:
+    PEOPLE_AC = None
+
+ACTION_SECTION_RE = re.compile(
+    r'(?:Action Items|Next Steps|Follow.?ups?)[:\s]*\n((?:[-*•]\s*.+\n?)+)',
+    re.IGNORECASE
+)
+BULLETS = ('-', '*', '•')
+
+PROJECT_PATTERNS = [
+    (re.compile(r'Project\s+Bedrock', re.IGNORECASE), 'Project Bedrock'),
+    (re.compile(r'Lean\s*Graph', re.IGNORECASE), 'Lean Graph'),
+    (re.compile(r'Metastore', re.IGNORECASE), 'Metastore'),
+    (re.compile(r'Lake\s*house', re.IGNORECASE), 'Lakehouse'),
+    (re.compile(r'Context\s*Store', re.IGNORECASE), 'Context Store'),
+    (re.compile(r'Polaris', re.IGNORECASE), 'Polaris'),
+    (re.compile(r'Cassandra\s+Operator', re.IGNORECASE), 'Cassandra Operator'),
+]
+
+
+def _walk_md(root):
+    """Yield DirEntry objects for markdown files under root, in Path.rglob order.
+    
+    os.scandir reuses the file type from the directory listing, avoiding the
+    per-entry stat calls and Path allocations of rglob.
+    """
+    stack = [root]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith('.md'):
+                    yield entry
+        stack.extend(reversed(subdirs))
+
 
 def extract_meetings_from_file(filepath):
     """Extract individual meetings from a daily file."""
@@ -76,95 +168,105 @@ def extract_meetings_from_file(filepath):
         print(f"Error reading {filepath}: {e}")
         return meetings
     
-    # Split by meeting headers (## Title)
-    # Pattern: ## Meeting Title followed by metadata
-    meeting_pattern = r'^## (.+?)$\n(?:\*\*Granola ID:\*\* ([a-f0-9-]+))?'
-    
-    # Split content into sections
-    sections = re.split(r'\n(?=## (?!Granola Notes))', content)
-    
-    for section in sections:
-        if not section.strip() or section.strip().startswith("## Granola Notes"):
-            continue
-            
-        # Extract title
-        title_match = re.match(r'^## (.+?)$', section, re.MULTILINE)
-        if not title_match:
-            continue
-            
-        title = title_match.group(1).strip()
-        
-        # Extract Granola ID
-        id_match = re.search(r'\*\*Granola ID:\*\* ([a-f0-9-]+)', section)
-        granola_id = id_match.group(1) if id_match else None
-        
-        # Extract dates
-        created_match = re.search(r'\*\*Created:\*\* ([^\n]+)', section)
-        created = created_match.group(1) if created_match else None
-        
-        # Extract transcript link
-        link_match = re.search(r'https://notes\.granola\.ai/t/([a-f0-9-]+)', section)
-        transcript_link = link_match.group(0) if link_match else None
-        
-        meetings.append({
-            "title": title,
-            "granola_id": granola_id,
-            "created": created,
-            "transcript_link": transcript_link,
-            "content": section,
-            "source_file": str(filepath),
-        })
+    # Walk headers and metadata in order; each header opens a new meeting
+    # and the first occurrence of each field within its section wins
+    section_start = 0
+    for match in SECTION_RX.finditer(content):
+        if match.group('header'):
+            if meetings:
+                # Section ends at the newline before the next header
+                meetings[-1]["content"] = content[section_start:match.start() - 1]
+            section_start = match.start()
+            meetings.append({
+                "title": match.group('title').strip(),
+                "granola_id": None,
+                "created": None,
+                "transcript_link": None,
+                "content": None,
+                "source_file": str(filepath),
+            })
+        elif meetings and meetings[-1][match.lastgroup] is None:
+            meetings[-1][match.lastgroup] = match.group(match.lastgroup)
+    
+    if meetings:
+        meetings[-1]["content"] = content[section_start:]
     
     return meetings
 
 
+@functools.lru_cache(maxsize=4096)
 def categorize_meeting(title):
-    """Categorize a meeting based on its title."""
-    title_lower = title.lower()
+    """Categorize a meeting based on its title.
     
-    # Check each pattern category
-    for category, patterns in PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, title, re.IGNORECASE):
-                return category
+    Memoized: recurring standups, syncs and 1:1s repeat the same titles.
+    """
+    # Check each pattern category; first matching category wins
+    for category, regex in CATEGORY_REGEX.items():
+        if regex.search(title):
+            return category
     
     return "other"
 
 
+def _is_word_char(c):
+    """Match the character class of regex \\w for word-boundary checks."""
+    return c.isalnum() or c == '_'
+
+
 def extract_people(title, content):
     """Extract people mentioned in meeting."""
     people = set()
     
     # Check title for 1:1 pattern
-    for pattern in PATTERNS["1on1"]:
-        match = re.match(pattern, title, re.IGNORECASE)
+    for pattern in COMPILED_PATTERNS["1on1"]:
+        match = pattern.match(title)
         if match:
             person = match.group(1).strip()
             # Clean up common suffixes
-            person = re.sub(r'\s*[-–]\s*\d+.*$', '', person)
-            person = re.sub(r'\s*<>.*$', '', person)
+            person = PERSON_SUFFIX_RE.sub('', person)
+            person = PERSON_ARROWS_RE.sub('', person)
             people.add(person)
     
     # Check for known people in content
-    for person in KNOWN_PEOPLE:
-        if re.search(rf'\b{person}\b', content, re.IGNORECASE):
+    if PEOPLE_AC is not None:
+        # One pass over the content finds every name; keep whole-word hits only
+        content_lower = content.lower()
+        last = len(content_lower) - 1
+        for end, person in PEOPLE_AC.iter(content_lower):
+            start = end - len(person) + 1
+            if start > 0 and _is_word_char(content_lower[start - 1]):
+                continue
+            if end < last and _is_word_char(content_lower[end + 1]):
+                continue
             people.add(person)
+    else:
+        # Tokenize once and intersect with the known names
+        tokens = set(TOKEN_RX.findall(content.lower()))
+        people.update(KNOWN_PEOPLE_LC[t] for t in tokens & KNOWN_PEOPLE_LC.keys())
     
     return list(people)
 
 
+def _bullet_items(block):
+    """Return the text after the bullet marker on each line of an action block."""
+    items = []
+    for line in block.split('\n'):
+        if line.startswith(BULLETS):
+            item = line[1:].lstrip()
+            if item:
+                items.append(item)
+    return items
+
+
 def extract_action_items(content):
     """Extract action items from meeting content."""
     actions = []
     
     # Look for action items section
-    action_section = re.search(
-        r'(?:Action Items|Next Steps|Follow.?ups?)[:\s]*\n((?:[-*•]\s*.+\n?)+)',
-        content, re.IGNORECASE
-    )
+    action_section = ACTION_SECTION_RE.search(content)
     
     if action_section:
-        items = re.findall(r'[-*•]\s*(.+)', action_section.group(1))
+        items = _bullet_items(action_section.group(1))
         actions.extend(items)
     
     return actions
@@ -174,112 +276,134 @@ def extract_projects(content):
     """Extract project references from content."""
     projects = set()
     
-    project_patterns = [
-        (r'Project\s+Bedrock', 'Project Bedrock'),
-        (r'Lean\s*Graph', 'Lean Graph'),
-        (r'Metastore', 'Metastore'),
-        (r'Lake\s*house', 'Lakehouse'),
-        (r'Context\s*Store', 'Context Store'),
-        (r'Polaris', 'Polaris'),
-        (r'Cassandra\s+Operator', 'Cassandra Operator'),
-    ]
-    
-    for pattern, name in project_patterns:
-        if re.search(pattern, content, re.IGNORECASE):
+    for pattern, name in PROJECT_PATTERNS:
+        if pattern.search(content):
             projects.add(name)
     
     return list(projects)
 
 
+def _process_meeting(meeting):
+    """Derive category, people, projects and action items for one meeting.
+    
+    The section text is only needed here, so it is dropped from the meeting.
+    """
+    content = meeting.pop("content")
+    meeting["category"] = categorize_meeting(meeting["title"])
+    meeting["people"] = extract_people(meeting["title"], content)
+    meeting["projects"] = extract_projects(content)
+    meeting["action_items"] = extract_action_items(content)
+    return meeting
+
+
+def _analyze_file(filepath):
+    """Read, split and process one file's meetings (runs in a worker process).
+    
+    File content never leaves the worker; only the derived fields are sent
+    back to the parent.
+    """
+    return [_process_meeting(meeting) for meeting in extract_meetings_from_file(filepath)]
+
+
 def analyze_vault():
     """Analyze all meetings in the vault."""
-    all_meetings = []
-    stats = defaultdict(int)
-    people_meetings = defaultdict(list)
-    project_meetings = defaultdict(list)
-    
-    # Process all markdown files
-    for md_file in VAULT_PATH.rglob("*.md"):
-        # Skip hidden files and special files
-        if md_file.name.startswith('.') or md_file.name.startswith('_'):
-            continue
-            
-        meetings = extract_meetings_from_file(md_file)
-        
-        for meeting in meetings:
-            # Categorize
-            category = categorize_meeting(meeting["title"])
-            meeting["category"] = category
-            stats[category] += 1
-            
-            # Extract people
-            people = extract_people(meeting["title"], meeting["content"])
-            meeting["people"] = people
-            for person in people:
-                people_meetings[person].append(meeting["title"])
-            
-            # Extract projects
-            projects = extract_projects(meeting["content"])
-            meeting["projects"] = projects
-            for project in projects:
-                project_meetings[project].append(meeting["title"])
-            
-            # Extract action items
-            actions = extract_action_items(meeting["content"])
-            meeting["action_items"] = actions
-            
-            all_meetings.append(meeting)
+    # Skip hidden files and special files
+    md_files = [
+        entry.path for entry in _walk_md(VAULT_PATH)
+        if not entry.name.startswith(('.', '_'))
+    ]
+    
+    # Regex-heavy extraction is CPU-bound and independent per file. Workers read
+    # the files themselves, so the parent never holds note content; results keep
+    # the walk order.
+    with ProcessPoolExecutor() as executor:
+        all_meetings = list(chain.from_iterable(
+            executor.map(_analyze_file, md_files, chunksize=FILE_CHUNKSIZE)
+        ))
+    
+    # Aggregate in bulk; only people keep per-meeting titles, projects just need counts
+    stats = Counter(m["category"] for m in all_meetings)
+    people_meetings = {}
+    for m in all_meetings:
+        for person in m["people"]:
+            people_meetings.setdefault(person, []).append(m["title"])
+    project_counts = Counter(chain.from_iterable(m["projects"] for m in all_meetings))
     
     return {
         "meetings": all_meetings,
         "stats": dict(stats),
         "people": {k: len(v) for k, v in people_meetings.items()},
-        "people_details": dict(people_meetings),
-        "projects": {k: len(v) for k, v in project_meetings.items()},
+        "people_details": people_meetings,
+        "projects": dict(project_counts),
         "total": len(all_meetings),
     }
 
 
+def write_analysis_json(analysis, path):
+    """Write the analysis as JSON, serializing one meeting at a time.
+    
+    Meetings no longer carry their full content (dropped in _process_meeting),
+    and every field is already a JSON-native type. Streaming the meetings array
+    avoids holding a second, fully serialized copy of it in memory.
+    """
+    if ORJSON_ENABLED:
+        dumps = orjson.dumps
+    else:
+        def dumps(obj):
+            return json.dumps(obj).encode('utf-8')
+    
+    with open(path, 'wb') as f:
+        for i, key in enumerate(("stats", "people", "projects", "total")):
+            f.write(b'{' if i == 0 else b',\n')
+            f.write(b'"' + key.encode() + b'": ')
+            f.write(dumps(analysis[key]))
+        f.write(b',\n"meetings": [')
+        for i, meeting in enumerate(analysis["meetings"]):
+            f.write(b'\n' if i == 0 else b',\n')
+            f.write(dumps(meeting))
+        f.write(b'\n]}\n')
+
+
 def generate_report(analysis):
     """Generate a markdown report of the analysis."""
-    report = []
-    report.append("# Meeting Analysis Report\n")
-    report.append(f"**Generated:** {datetime.now().isoformat()}\n")
-    report.append(f"**Total Meetings:** {analysis['total']}\n")
+    report = io.StringIO()
+    report.write("# Meeting Analysis Report\n\n")
+    report.write(f"**Generated:** {datetime.now().isoformat()}\n\n")
+    report.write(f"**Total Meetings:** {analysis['total']}\n\n")
     
     # Category breakdown
-    report.append("\n## Meeting Categories\n")
-    report.append("| Category | Count |")
-    report.append("|----------|-------|")
+    report.write("\n## Meeting Categories\n\n")
+    report.write("| Category | Count |\n")
+    report.write("|----------|-------|\n")
     for cat, count in sorted(analysis['stats'].items(), key=lambda x: -x[1]):
-        report.append(f"| {cat} | {count} |")
+        report.write(f"| {cat} | {count} |\n")
     
     # People breakdown
-    report.append("\n## People (by meeting count)\n")
-    report.append("| Person | Meetings |")
-    report.append("|--------|----------|")
+    report.write("\n## People (by meeting count)\n\n")
+    report.write("| Person | Meetings |\n")
+    report.write("|--------|----------|\n")
     for person, count in sorted(analysis['people'].items(), key=lambda x: -x[1])[:30]:
-        report.append(f"| {person} | {count} |")
+        report.write(f"| {person} | {count} |\n")
     
     # Projects breakdown
-    report.append("\n## Projects (by mention count)\n")
-    report.append("| Project | Mentions |")
-    report.append("|---------|----------|")
+    report.write("\n## Projects (by mention count)\n\n")
+    report.write("| Project | Mentions |\n")
+    report.write("|---------|----------|\n")
     for project, count in sorted(analysis['projects'].items(), key=lambda x: -x[1]):
-        report.append(f"| {project} | {count} |")
+        report.write(f"| {project} | {count} |\n")
     
     # Sample meetings by category
-    report.append("\n## Sample Meetings by Category\n")
+    report.write("\n## Sample Meetings by Category\n\n")
     by_category = defaultdict(list)
     for m in analysis['meetings']:
         by_category[m['category']].append(m['title'])
     
     for cat in sorted(by_category.keys()):
-        report.append(f"\n### {cat}\n")
+        report.write(f"\n### {cat}\n\n")
         for title in by_category[cat][:5]:
-            report.append(f"- {title}")
+            report.write(f"- {title}\n")
     
-    return "\n".join(report)
+    return report.getvalue()
 
 
 if __name__ == "__main__":
@@ -289,19 +413,7 @@ if __name__ == "__main__":
     analysis = analyze_vault()
     
     # Save raw analysis
-    with open(OUTPUT_PATH / "meetings_analysis.json", 'w') as f:
-        # Don't include full content in JSON (too large)
-        export = {
-            "stats": analysis["stats"],
-            "people": analysis["people"],
-            "projects": analysis["projects"],
-            "total": analysis["total"],
-            "meetings": [
-                {k: v for k, v in m.items() if k != "content"}
-                for m in analysis["meetings"]
-            ]
-        }
-        json.dump(export, f, indent=2, default=str)
+    write_analysis_json(analysis, OUTPUT_PATH / "meetings_analysis.json")
     
     # Generate report
     report = generate_report(analysis)
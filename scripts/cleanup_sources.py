@@ -2,6 +2,7 @@
 """Remove processed source files from Granola/Transcripts folder."""
 
 import json
+import os
 from pathlib import Path
 
 STATE_FILE = Path("/home/Arnab/clawd/projects/knowledge-graph/data/sync_state.json")
@@ -15,13 +16,22 @@ def main():
     skipped = 0
     
     for path_str, info in state.get('processed', {}).items():
+        output_str = info.get('output', path_str)
+        
+        # Organized in place: nothing to remove, no need to stat
+        if output_str == path_str:
+            continue
+        
         source = Path(path_str)
-        output = Path(info.get('output', path_str))
+        output = Path(output_str)
         
-        # Only remove if source != output and source exists
-        if source.resolve() != output.resolve() and source.exists():
+        # Only remove if source exists and is not the output itself
+        if source.exists():
             # Verify output exists before removing source
             if output.exists():
+                # Same file reached through a symlink or alternate path
+                if os.path.samefile(source, output):
+                    continue
                 source.unlink()
                 print(f"Removed: {source.name}")
                 removed += 1
@@ -3,6 +3,7 @@
 Generate derived insight documents for RAG from organized meeting notes.
 """
 
+import io
 import os
 import re
 import json
@@ -10,19 +11,163 @@ from pathlib import Path
 from collections import defaultdict
 from datetime import datetime
 
+# Optional RE2 engine (google-re2): linear-time matching for corpus-wide scans
+try:
+    import re2
+    USE_RE2 = True
+except ImportError:
+    re2 = None
+    USE_RE2 = False
+
+# Optional orjson (C extension) for the meetings_analysis.json round trip
+try:
+    import orjson
+    ORJSON_ENABLED = True
+except ImportError:
+    orjson = None
+    ORJSON_ENABLED = False
+
 ORGANIZED_PATH = Path("/home/Arnab/clawd/projects/career-agent/obsidian/organized")
 INSIGHTS_PATH = ORGANIZED_PATH / "insights"
 ANALYSIS_PATH = Path("/home/Arnab/clawd/projects/career-agent/analysis")
 
 # Load analysis
-with open(ANALYSIS_PATH / "meetings_analysis.json") as f:
-    analysis = json.load(f)
+with open(ANALYSIS_PATH / "meetings_analysis.json", 'rb') as f:
+    analysis = orjson.loads(f.read()) if ORJSON_ENABLED else json.load(f)
+
+
+def _compile(pattern, flags=0):
+    """Compile with RE2 when available, falling back to re for unsupported syntax."""
+    if USE_RE2:
+        inline = ''.join(c for f, c in ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm')) if flags & f)
+        prefix = f"(?{inline})" if inline else ""
+        if isinstance(pattern, bytes):
+            prefix = prefix.encode()
+        try:
+            return re2.compile(prefix + pattern)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+
+def _decode(data):
+    """Decode a matched byte string for output."""
+    return data.decode('utf-8', 'replace')
+
+
+def _read_note(path):
+    """Read a note as bytes with universal newlines, like read_text (CRLF/CR -> LF)."""
+    return path.read_bytes().replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+
+# Precompiled once at import; every generator below runs these per file.
+# Note contents are scanned as raw bytes (all patterns are ASCII apart from
+# the UTF-8 bullet "•"), so only the matched fragments are ever decoded.
+HEADER_RE = _compile(rb'^### (.+)$', re.MULTILINE)
+DATE_RE = _compile(r'(\d{4}-\d{2}-\d{2})')
+PROFILE_ACTION_SECTION_RE = re.compile(
+    rb'(?:Action Items|Next Steps)[:\s]*\n((?:(?:[-*]|\xe2\x80\xa2)\s*.+\n?)+)',
+    re.IGNORECASE
+)
+BULLETS = (b'-', b'*', '•'.encode())
+OWNER_RE = re.compile(r'^([A-Z][a-z]+)[:\s]')
+
+# Headers, both decision phrasings and action-item blocks in one scan per note.
+# Each alternative consumes only its leading keyword and captures the rest in a
+# lookahead, so matches of one kind never hide matches of another (e.g. an
+# "### Action Items" header is both a topic and the start of an action block).
+# Lookarounds are not supported by RE2, so this is compiled with re directly.
+SCAN_RX = re.compile(
+    rb'^### (?=(?P<header>.+)$)'
+    rb'|(?:decided|decision|agreed|approved)(?=[:\s]+(?P<decision>.+?)(?:\n|$))'
+    rb'|(?:will|going to)(?=\s+(?:proceed|move forward)\s+with\s+(?P<proceed>.+?)(?:\n|$))'
+    rb'|(?:Action Items|Next Steps|Follow.?ups?)(?=[:\s]*\n(?P<actions>(?:(?:[-*]|\xe2\x80\xa2)\s*.+\n?)+))',
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+def _bullet_items(block):
+    """Return the text after the bullet marker on each line of an action block."""
+    items = []
+    for line in block.split(b'\n'):
+        for bullet in BULLETS:
+            if line.startswith(bullet):
+                item = line[len(bullet):].lstrip()
+                if item:
+                    items.append(item)
+                break
+    return items
+
+
+def _leading_date(name):
+    """Return the YYYY-MM-DD prefix of a filename, or None (same as matching DATE_RE)."""
+    if (len(name) >= 10 and name[4] == '-' and name[7] == '-'
+            and name[:4].isdecimal() and name[5:7].isdecimal() and name[8:10].isdecimal()):
+        return name[:10]
+    return None
+
+
+def _scan_file(content):
+    """Collect headers, decisions and the first action block of a note in one pass."""
+    found = {"header": [], "decision": [], "proceed": [], "actions": None}
+    # Decision phrasings may nest; only keep non-overlapping matches per phrasing
+    resume_at = {"decision": 0, "proceed": 0}
+    
+    for match in SCAN_RX.finditer(content):
+        kind = match.lastgroup
+        if kind == "header":
+            found["header"].append(match.group(kind))
+        elif kind == "actions":
+            if found["actions"] is None:
+                found["actions"] = match.group(kind)
+        elif match.start() >= resume_at[kind]:
+            found[kind].append(match.group(kind))
+            resume_at[kind] = match.end(kind)
+    
+    return {
+        "headers": found["header"],
+        "decisions": found["decision"] + found["proceed"],
+        "actions": found["actions"],
+    }
+
+
+def _walk_md(root):
+    """Yield DirEntry objects for markdown files under root, in Path.rglob order.
+    
+    os.scandir reuses the file type from the directory listing, avoiding the
+    per-entry stat calls and Path allocations of rglob.
+    """
+    stack = [root]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith('.md'):
+                    yield entry
+        stack.extend(reversed(subdirs))
+
+
+def _scan_all_markdown():
+    """Scan every organized note (excluding insights) once for the corpus-wide generators."""
+    results = []
+    for entry in _walk_md(ORGANIZED_PATH):
+        if 'insights' in entry.path:
+            continue
+        md_file = Path(entry.path)
+        try:
+            results.append((md_file, _scan_file(_read_note(md_file))))
+        except Exception:
+            pass
+    return results
 
 
 def generate_people_profiles():
     """Generate a profile document for each person with meeting history."""
     people_path = ORGANIZED_PATH / "people"
-    profiles = []
+    # Parallel per-person columns instead of one dict per profile
+    names, slugs, counts, firsts, lasts, topics_list, actions_list = [], [], [], [], [], [], []
     
     if not people_path.exists():
         return
@@ -44,79 +189,86 @@ def generate_people_profiles():
         
         for meeting_file in sorted(meetings):
             # Extract date from filename
-            date_match = re.match(r'(\d{4}-\d{2}-\d{2})', meeting_file.name)
-            if date_match:
-                dates.append(date_match.group(1))
+            date = _leading_date(meeting_file.name)
+            if date:
+                dates.append(date)
             
             # Read content for topics
             try:
-                content = meeting_file.read_text()
+                content = _read_note(meeting_file)
                 
                 # Extract section headers as topics
-                headers = re.findall(r'^### (.+)$', content, re.MULTILINE)
-                topics.extend(headers[:5])
+                headers = HEADER_RE.findall(content)
+                topics.extend(_decode(h) for h in headers[:5])
                 
                 # Extract action items
-                action_section = re.search(
-                    r'(?:Action Items|Next Steps)[:\s]*\n((?:[-*•]\s*.+\n?)+)',
-                    content, re.IGNORECASE
-                )
+                action_section = PROFILE_ACTION_SECTION_RE.search(content)
                 if action_section:
-                    items = re.findall(r'[-*•]\s*(.+)', action_section.group(1))
-                    action_items.extend(items[:3])
+                    items = _bullet_items(action_section.group(1))
+                    action_items.extend(_decode(item) for item in items[:3])
             except:
                 pass
         
         # Build profile
-        profile = {
-            "name": person_name,
-            "slug": person_dir.name,
-            "meeting_count": len(meetings),
-            "first_meeting": min(dates) if dates else "unknown",
-            "last_meeting": max(dates) if dates else "unknown",
-            "common_topics": list(set(topics))[:10],
-            "recent_action_items": action_items[-5:],
-        }
-        profiles.append(profile)
+        names.append(person_name)
+        slugs.append(person_dir.name)
+        counts.append(len(meetings))
+        firsts.append(min(dates) if dates else "unknown")
+        lasts.append(max(dates) if dates else "unknown")
+        topics_list.append(list(set(topics))[:10])
+        actions_list.append(action_items[-5:])
     
     # Write profiles document
     INSIGHTS_PATH.mkdir(parents=True, exist_ok=True)
     
-    output = ["# People Profiles\n"]
-    output.append(f"*Generated: {datetime.now().strftime('%Y-%m-%d')}*\n")
-    output.append("Quick reference for 1:1s and team context.\n")
+    output = io.StringIO()
+    output.write("# People Profiles\n\n")
+    output.write(f"*Generated: {datetime.now().strftime('%Y-%m-%d')}*\n\n")
+    output.write("Quick reference for 1:1s and team context.\n\n")
     
-    # Sort by meeting count
-    profiles.sort(key=lambda x: -x['meeting_count'])
+    # Sort by meeting count (stable, so ties keep directory order)
+    order = sorted(range(len(names)), key=lambda i: -counts[i])
     
-    for p in profiles[:50]:  # Top 50 people
-        output.append(f"\n## {p['name']}\n")
-        output.append(f"- **Meetings:** {p['meeting_count']}")
-        output.append(f"- **Active:** {p['first_meeting']} to {p['last_meeting']}")
+    for i in order[:50]:  # Top 50 people
+        output.write(f"\n## {names[i]}\n\n")
+        output.write(f"- **Meetings:** {counts[i]}\n")
+        output.write(f"- **Active:** {firsts[i]} to {lasts[i]}\n")
         
-        if p['common_topics']:
-            output.append(f"- **Topics:** {', '.join(p['common_topics'][:5])}")
+        if topics_list[i]:
+            output.write(f"- **Topics:** {', '.join(topics_list[i][:5])}\n")
         
-        if p['recent_action_items']:
-            output.append(f"- **Recent Actions:**")
-            for item in p['recent_action_items'][:3]:
-                output.append(f"  - {item[:100]}")
+        if actions_list[i]:
+            output.write(f"- **Recent Actions:**\n")
+            for item in actions_list[i][:3]:
+                output.write(f"  - {item[:100]}\n")
         
-        output.append(f"- **Notes:** [[people/{p['slug']}]]")
+        output.write(f"- **Notes:** [[people/{slugs[i]}]]\n")
     
     with open(INSIGHTS_PATH / "people-profiles.md", 'w') as f:
-        f.write('\n'.join(output))
-    
-    print(f"Generated profiles for {len(profiles)} people")
-    return profiles
+        f.write(output.getvalue())
+    
+    print(f"Generated profiles for {len(names)} people")
+    return [
+        {
+            "name": names[i],
+            "slug": slugs[i],
+            "meeting_count": counts[i],
+            "first_meeting": firsts[i],
+            "last_meeting": lasts[i],
+            "common_topics": topics_list[i],
+            "recent_action_items": actions_list[i],
+        }
+        for i in order
+    ]
 
 
 def generate_project_status():
     """Generate project status summary from recent meetings."""
     projects_path = ORGANIZED_PATH / "projects"
     
-    output = ["# Project Status\n"]
-    output.append(f"*Generated: {datetime.now().strftime('%Y-%m-%d')}*\n")
+    output = io.StringIO()
+    output.write("# Project Status\n\n")
+    output.write(f"*Generated: {datetime.now().strftime('%Y-%m-%d')}*\n\n")
     
     project_info = {
         "bedrock": {
@@ -151,67 +303,55 @@ def generate_project_status():
             
             meetings = sorted(project_dir.glob("*.md"), reverse=True)
             
-            output.append(f"\n## {info['name']}\n")
-            output.append(f"{info['description']}\n")
-            output.append(f"**Meeting Count:** {len(meetings)}")
+            output.write(f"\n## {info['name']}\n\n")
+            output.write(f"{info['description']}\n\n")
+            output.write(f"**Meeting Count:** {len(meetings)}\n")
             
             if meetings:
                 # Get most recent meeting summary
                 recent = meetings[0]
-                date_match = re.match(r'(\d{4}-\d{2}-\d{2})', recent.name)
-                if date_match:
-                    output.append(f"**Last Update:** {date_match.group(1)}")
+                date = _leading_date(recent.name)
+                if date:
+                    output.write(f"**Last Update:** {date}\n")
                 
                 try:
-                    content = recent.read_text()
+                    content = _read_note(recent)
                     # Extract key points
-                    headers = re.findall(r'^### (.+)$', content, re.MULTILINE)
+                    headers = HEADER_RE.findall(content)
                     if headers:
-                        output.append(f"**Recent Topics:** {', '.join(headers[:5])}")
+                        output.write(f"**Recent Topics:** {', '.join(_decode(h) for h in headers[:5])}\n")
                 except:
                     pass
             
-            output.append(f"**Notes:** [[projects/{project_slug}]]")
+            output.write(f"**Notes:** [[projects/{project_slug}]]\n")
     
     with open(INSIGHTS_PATH / "project-status.md", 'w') as f:
-        f.write('\n'.join(output))
+        f.write(output.getvalue())
     
     print("Generated project status")
 
 
-def generate_recent_decisions():
+def generate_recent_decisions(files):
     """Extract recent decisions from meetings."""
-    output = ["# Decisions Log\n"]
-    output.append(f"*Generated: {datetime.now().strftime('%Y-%m-%d')}*\n")
-    output.append("Key decisions extracted from recent meetings.\n")
+    output = io.StringIO()
+    output.write("# Decisions Log\n\n")
+    output.write(f"*Generated: {datetime.now().strftime('%Y-%m-%d')}*\n\n")
+    output.write("Key decisions extracted from recent meetings.\n\n")
     
     decisions = []
     
     # Scan recent files for decision-like content
-    for md_file in ORGANIZED_PATH.rglob("*.md"):
-        if 'insights' in str(md_file):
-            continue
-            
+    for md_file, scan in files:
         try:
-            content = md_file.read_text()
-            
-            # Look for decision patterns
-            decision_patterns = [
-                r'(?:decided|decision|agreed|approved)[:\s]+(.+?)(?:\n|$)',
-                r'(?:will|going to)\s+(?:proceed|move forward)\s+with\s+(.+?)(?:\n|$)',
-            ]
-            
-            for pattern in decision_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    if len(match) > 20 and len(match) < 200:
-                        date_match = re.search(r'(\d{4}-\d{2}-\d{2})', str(md_file))
-                        date = date_match.group(1) if date_match else 'unknown'
-                        decisions.append({
-                            "date": date,
-                            "decision": match.strip(),
-                            "source": md_file.name,
-                        })
+            date_match = DATE_RE.search(str(md_file))
+            date = date_match.group(1) if date_match else 'unknown'
+            for match in map(_decode, scan["decisions"]):
+                if len(match) > 20 and len(match) < 200:
+                    decisions.append({
+                        "date": date,
+                        "decision": match.strip(),
+                        "source": md_file.name,
+                    })
         except:
             pass
     
@@ -225,47 +365,40 @@ def generate_recent_decisions():
         by_month[month].append(d)
     
     for month in sorted(by_month.keys(), reverse=True)[:6]:
-        output.append(f"\n## {month}\n")
+        output.write(f"\n## {month}\n\n")
         for d in by_month[month][:10]:
-            output.append(f"- **{d['date']}:** {d['decision']}")
-            output.append(f"  - Source: {d['source']}")
+            output.write(f"- **{d['date']}:** {d['decision']}\n")
+            output.write(f"  - Source: {d['source']}\n")
     
     with open(INSIGHTS_PATH / "decisions-log.md", 'w') as f:
-        f.write('\n'.join(output))
+        f.write(output.getvalue())
     
     print(f"Extracted {len(decisions)} decisions")
 
 
-def generate_action_items():
+def generate_action_items(files):
     """Extract open action items from recent meetings."""
-    output = ["# Action Items\n"]
-    output.append(f"*Generated: {datetime.now().strftime('%Y-%m-%d')}*\n")
-    output.append("Action items from recent meetings (may include completed items).\n")
+    output = io.StringIO()
+    output.write("# Action Items\n\n")
+    output.write(f"*Generated: {datetime.now().strftime('%Y-%m-%d')}*\n\n")
+    output.write("Action items from recent meetings (may include completed items).\n\n")
     
     all_actions = []
     
     # Scan recent files
-    for md_file in ORGANIZED_PATH.rglob("*.md"):
-        if 'insights' in str(md_file):
-            continue
-            
+    for md_file, scan in files:
         try:
-            content = md_file.read_text()
-            
-            # Find action items sections
-            action_section = re.search(
-                r'(?:Action Items|Next Steps|Follow.?ups?)[:\s]*\n((?:[-*•]\s*.+\n?)+)',
-                content, re.IGNORECASE
-            )
+            # First action items section of the note
+            action_section = scan["actions"]
             
             if action_section:
-                items = re.findall(r'[-*•]\s*(.+)', action_section.group(1))
-                date_match = re.search(r'(\d{4}-\d{2}-\d{2})', str(md_file))
+                items = [_decode(item) for item in _bullet_items(action_section)]
+                date_match = DATE_RE.search(str(md_file))
                 date = date_match.group(1) if date_match else 'unknown'
                 
                 for item in items:
                     # Extract owner if mentioned
-                    owner_match = re.match(r'^([A-Z][a-z]+)[:\s]', item)
+                    owner_match = OWNER_RE.match(item)
                     owner = owner_match.group(1) if owner_match else None
                     
                     all_actions.append({
@@ -281,7 +414,7 @@ def generate_action_items():
     all_actions.sort(key=lambda x: x['date'], reverse=True)
     
     # Recent actions (last 30 days worth)
-    output.append("\n## Recent Action Items\n")
+    output.write("\n## Recent Action Items\n\n")
     
     by_owner = defaultdict(list)
     for a in all_actions[:200]:
@@ -291,33 +424,29 @@ def generate_action_items():
     for owner in sorted(by_owner.keys()):
         items = by_owner[owner][:10]
         if items:
-            output.append(f"\n### {owner}\n")
+            output.write(f"\n### {owner}\n\n")
             for a in items:
-                output.append(f"- [{a['date']}] {a['item']}")
+                output.write(f"- [{a['date']}] {a['item']}\n")
     
     with open(INSIGHTS_PATH / "action-items.md", 'w') as f:
-        f.write('\n'.join(output))
+        f.write(output.getvalue())
     
     print(f"Extracted {len(all_actions)} action items")
 
 
-def generate_topics_index():
+def generate_topics_index(files):
     """Generate an index of common topics."""
-    output = ["# Topics Index\n"]
-    output.append(f"*Generated: {datetime.now().strftime('%Y-%m-%d')}*\n")
+    output = io.StringIO()
+    output.write("# Topics Index\n\n")
+    output.write(f"*Generated: {datetime.now().strftime('%Y-%m-%d')}*\n\n")
     
     topics = defaultdict(int)
     
-    for md_file in ORGANIZED_PATH.rglob("*.md"):
-        if 'insights' in str(md_file):
-            continue
-            
+    for md_file, scan in files:
         try:
-            content = md_file.read_text()
-            headers = re.findall(r'^### (.+)$', content, re.MULTILINE)
-            for h in headers:
+            for h in scan["headers"]:
                 # Normalize
-                h_clean = h.strip().lower()
+                h_clean = _decode(h).strip().lower()
                 if len(h_clean) > 5 and len(h_clean) < 50:
                     topics[h_clean] += 1
         except:
@@ -326,14 +455,14 @@ def generate_topics_index():
     # Sort by frequency
     sorted_topics = sorted(topics.items(), key=lambda x: -x[1])
     
-    output.append("## Most Common Topics\n")
-    output.append("| Topic | Occurrences |")
-    output.append("|-------|-------------|")
+    output.write("## Most Common Topics\n\n")
+    output.write("| Topic | Occurrences |\n")
+    output.write("|-------|-------------|\n")
     for topic, count in sorted_topics[:50]:
-        output.append(f"| {topic.title()} | {count} |")
+        output.write(f"| {topic.title()} | {count} |\n")
     
     with open(INSIGHTS_PATH / "topics-index.md", 'w') as f:
-        f.write('\n'.join(output))
+        f.write(output.getvalue())
     
     print(f"Indexed {len(topics)} unique topics")
 
@@ -343,8 +472,11 @@ if __name__ == "__main__":
     
     generate_people_profiles()
     generate_project_status()
-    generate_recent_decisions()
-    generate_action_items()
-    generate_topics_index()
+    
+    # Scan the organized notes once and share the matches across the corpus-wide generators
+    files = _scan_all_markdown()
+    generate_recent_decisions(files)
+    generate_action_items(files)
+    generate_topics_index(files)
     
     print(f"\nInsights saved to: {INSIGHTS_PATH}")
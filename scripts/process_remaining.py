@@ -6,19 +6,35 @@ Process remaining vault content (non-Granola daily files).
 - Skip outdated/partial content
 """
 
+import io
 import os
 import re
+import sys
 import shutil
+import hashlib
+import functools
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional Aho-Corasick automaton (pyahocorasick) for single-pass keyword scoring
+try:
+    import ahocorasick
+    AHOCORASICK_ENABLED = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_ENABLED = False
 
 VAULT_PATH = Path("/home/Arnab/clawd/projects/career-agent/obsidian/vault")
 ORGANIZED_PATH = Path("/home/Arnab/clawd/projects/career-agent/obsidian/organized")
 PERSONAL_PATH = Path("/home/Arnab/clawd/projects/career-agent/obsidian/personal")
 
+# Worker threads for reading and classifying files (I/O-bound)
+FILE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 # Content classification keywords
-PERSONAL_KEYWORDS = [
+PERSONAL_KEYWORDS = tuple(map(sys.intern, [
     'richie', 'daycare', 'pet', 'grocery', 'medical claim', 'health',
     'retinal', 'ffa', 'oct', 'bridal', 'kamloops', 'vacation', 'trip',
     'pr card', 'immigration', 'driving license', 'passport', 'visa',
@@ -27,9 +43,9 @@ PERSONAL_KEYWORDS = [
     'books to read', 'meditat', 'personal', 'family', 'wedding',
     'rogers', 'telus', 'shaw', 'hydro', 'utilities', 'insurance',
     'doctor', 'dentist', 'clinic', 'prescription', 'pharmacy',
-]
+]))
 
-WORK_KEYWORDS = [
+WORK_KEYWORDS = tuple(map(sys.intern, [
     'atlan', 'metastore', 'lakehouse', 'bedrock', 'polaris', 'phoenix',
     'kubernetes', 'k8s', 'argocd', 'helm', 'terraform', 'aws', 'gcp', 'azure',
     'cassandra', 'elasticsearch', 'kafka', 'redis', 'postgres',
@@ -41,62 +57,190 @@ WORK_KEYWORDS = [
     'jira', 'linear', 'github', 'gitlab', 'confluence',
     'interview', 'hiring', 'candidate', 'performance review',
     'manager', 'leadership', 'team', 'epd', 'product',
-]
+]))
+
+if AHOCORASICK_ENABLED:
+    KEYWORD_AC = ahocorasick.Automaton()
+    for _kw in WORK_KEYWORDS:
+        KEYWORD_AC.add_word(_kw, ('work', _kw))
+    for _kw in PERSONAL_KEYWORDS:
+        KEYWORD_AC.add_word(_kw, ('personal', _kw))
+    KEYWORD_AC.make_automaton()
+else:
+    KEYWORD_AC = None
 
 SKIP_PATTERNS = [
     r'^\.', r'\.DS_Store', r'_index\.md$', r'^Media$',
 ]
-
-stats = defaultdict(int)
+SKIP_RE = re.compile('|'.join(SKIP_PATTERNS))
+SKIP_DIRS = frozenset({'Media', '.obsidian', '.trash'})
+
+# Path fragments that mark a file as work outside Apple Notes ('/atlan/' is
+# checked separately because Apple Notes has its own Atlan folder)
+WORK_PATH_HINTS = (
+    '/lakehouse/', '/metastore/', '/project bedrock/', '/team - 2026/',
+    '/performance review/',
+)
+# Apple Notes/Canada holds mixed content; personal hints are checked first
+CANADA_PERSONAL_HINTS = ('pr card', 'immigration', 'driving', 'richie', 'pet', 'address')
+CANADA_WORK_HINTS = ('interview prep', 'job apply', 'tetrate')
+
+# 1:1 filename patterns: "Person <> Arnab", "Person / Arnab", etc. Each branch is a
+# lookahead from the start, so the first listed pattern that matches still wins.
+PERSON_RE = re.compile(
+    r'^(?:(?=(?P<before_lt>.+?)\s*<>\s*Arnab)'
+    r'|(?=(?P<before_slash>.+?)\s*/\s*Arnab)'
+    r'|(?=Arnab\s*<>\s*(?P<after_lt>.+))'
+    r'|(?=Arnab\s*/\s*(?P<after_slash>.+)))',
+    re.IGNORECASE
+)
+PERSON_DATE_SUFFIX_RE = re.compile(r'\s*[-–]\s*\d+.*$')
+
+# Filename date formats in priority order: "1st May 25", "2025-05-01", "1/5/25".
+# As with PERSON_RE, lookahead branches keep the per-format priority of separate searches.
+DATE_RE = re.compile(
+    r'^(?:(?=.*?(?P<dmy>(\d{1,2})(?:st|nd|rd|th)?\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s*(\d{2,4})))'
+    r'|(?=.*?(?P<iso>(\d{4})-(\d{2})-(\d{2})))'
+    r'|(?=.*?(?P<slash>(\d{1,2})/(\d{1,2})/(\d{2,4}))))',
+    re.IGNORECASE | re.DOTALL
+)
+MONTHS = {'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04', 'may': '05', 'jun': '06',
+          'jul': '07', 'aug': '08', 'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'}
+
+# slugify: drop punctuation, then collapse whitespace/underscore/hyphen runs to one '-'
+SLUG_DROP_RE = re.compile(r'[^\w\s-]+')
+SLUG_SEPARATOR_RE = re.compile(r'[\s_-]+')
+
+stats = Counter()
+# classification -> Counter of categories
+category_stats = {'work': Counter(), 'personal': Counter()}
 processed_files = []
 skipped_files = []
+# output_dir -> names already present or written there this run
+WRITTEN = {}
+# blake2b digest of scored text -> keyword_winner result (bounded, never evicted)
+KEYWORD_CACHE = {}
+KEYWORD_CACHE_SIZE = 8192
 
 
+@functools.lru_cache(maxsize=4096)
 def slugify(text):
     """Convert text to safe filename."""
-    text = str(text).lower()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[\s_]+', '-', text)
-    text = re.sub(r'-+', '-', text)
+    text = SLUG_DROP_RE.sub('', str(text).lower())
+    text = SLUG_SEPARATOR_RE.sub('-', text)
     return text.strip('-')[:60]
 
 
 def should_skip(filepath):
     """Check if file should be skipped."""
-    name = filepath.name
-    for pattern in SKIP_PATTERNS:
-        if re.search(pattern, name):
-            return True
-    return False
+    return bool(SKIP_RE.search(filepath.name))
 
 
 def get_file_content(filepath):
-    """Read file content safely."""
+    """Read file content safely.
+    
+    One open/fstat/read/close instead of the buffered text-mode stack; the
+    decoded text matches read_text (strict UTF-8, universal newlines).
+    """
     try:
-        return filepath.read_text(encoding='utf-8')
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            data = os.read(fd, size + 1)
+            if len(data) > size:
+                # File grew since fstat; read the rest
+                with open(fd, 'rb', closefd=False) as f:
+                    data += f.read()
+        finally:
+            os.close(fd)
+        text = data.decode('utf-8')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
     except Exception as e:
         return None
 
 
-def classify_content(filepath, content):
-    """Classify content as 'work', 'personal', or 'skip'."""
-    name = filepath.name.lower()
-    path_str = str(filepath).lower()
-    content_lower = (content or '').lower()[:5000]  # First 5k chars
+def keyword_scores_decided(work_score, personal_score, work_left, personal_left):
+    """True once the unscanned keywords can no longer change classify_content's result."""
+    if personal_score > work_score + work_left:
+        return True  # personal wins however many work keywords remain
+    return work_score > 0 and work_score >= personal_score + personal_left
+
+
+def keyword_winner(text_to_check):
+    """Score keywords in text_to_check; 'personal', 'work', or None if no keyword hit.
+    
+    Only "personal > work" and "work > 0" matter, so scanning stops once the
+    keywords not yet seen can no longer change that.
+    """
+    work_score = 0
+    personal_score = 0
+    work_left = len(WORK_KEYWORDS)
+    personal_left = len(PERSONAL_KEYWORDS)
+    
+    if KEYWORD_AC is not None:
+        # One pass over the text; each keyword counts once, however often it occurs
+        seen = set()
+        for _, hit in KEYWORD_AC.iter(text_to_check):
+            if hit in seen:
+                continue
+            seen.add(hit)
+            if hit[0] == 'work':
+                work_score += 1
+                work_left -= 1
+            else:
+                personal_score += 1
+                personal_left -= 1
+            if keyword_scores_decided(work_score, personal_score, work_left, personal_left):
+                break
+    else:
+        for kw in WORK_KEYWORDS:
+            if kw in text_to_check:
+                work_score += 1
+        work_left = 0
+        
+        for kw in PERSONAL_KEYWORDS:
+            if keyword_scores_decided(work_score, personal_score, work_left, personal_left):
+                break
+            personal_left -= 1
+            if kw in text_to_check:
+                personal_score += 1
+    
+    if personal_score > work_score:
+        return 'personal'
+    elif work_score > 0:
+        return 'work'
+    return None
+
+
+def cached_keyword_winner(text_to_check):
+    """keyword_winner, memoized by a blake2b digest of the text.
+    
+    Duplicate imports (same filename and leading content in several folders)
+    skip the keyword scan; hashing 5k chars costs about a tenth of scanning them.
+    """
+    key = hashlib.blake2b(text_to_check.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    if key in KEYWORD_CACHE:
+        return KEYWORD_CACHE[key]
+    winner = keyword_winner(text_to_check)
+    if len(KEYWORD_CACHE) < KEYWORD_CACHE_SIZE:
+        KEYWORD_CACHE[key] = winner
+    return winner
+
+
+def classify_content(name, path_str, content):
+    """Classify content as 'work', 'personal', or 'skip'.
     
+    name/path_str are the lowercased filename and path. Content is only
+    lowercased (first 5k chars) once the path hints have not decided.
+    """
     # Check path-based hints first
     if '/atlan/' in path_str and '/apple notes/' not in path_str:
         return 'work'
-    if '/lakehouse/' in path_str:
-        return 'work'
-    if '/metastore/' in path_str:
-        return 'work'
-    if '/project bedrock/' in path_str:
-        return 'work'
-    if '/team - 2026/' in path_str:
-        return 'work'
-    if '/performance review/' in path_str:
-        return 'work'
+    for hint in WORK_PATH_HINTS:
+        if hint in path_str:
+            return 'work'
     
     # Check for personal content in Apple Notes
     if '/apple notes/' in path_str:
@@ -105,10 +249,11 @@ def classify_content(filepath, content):
             return 'personal'
         if '/canada/' in path_str:
             # Canada folder has mixed content
-            for kw in ['pr card', 'immigration', 'driving', 'richie', 'pet', 'address']:
+            content_lower = content[:5000].lower()
+            for kw in CANADA_PERSONAL_HINTS:
                 if kw in name or kw in content_lower:
                     return 'personal'
-            for kw in ['interview prep', 'job apply', 'tetrate']:
+            for kw in CANADA_WORK_HINTS:
                 if kw in name or kw in content_lower:
                     return 'work'
             return 'personal'  # Default Canada stuff to personal
@@ -121,41 +266,24 @@ def classify_content(filepath, content):
         if '/atlan/' in path_str:
             return 'work'
     
-    # Score based on keywords
-    work_score = 0
-    personal_score = 0
-    
-    text_to_check = name + ' ' + content_lower
-    
-    for kw in WORK_KEYWORDS:
-        if kw in text_to_check:
-            work_score += 1
-    
-    for kw in PERSONAL_KEYWORDS:
-        if kw in text_to_check:
-            personal_score += 1
-    
     # Content length check - very short content might be outdated/partial
     if content and len(content.strip()) < 50:
         return 'skip'
     
-    if personal_score > work_score:
+    # Score based on keywords
+    content_lower = content[:5000].lower()  # First 5k chars
+    winner = cached_keyword_winner(name + ' ' + content_lower)
+    if winner:
+        return winner
+    
+    # Default: check path
+    if '/apple notes/' in path_str:
         return 'personal'
-    elif work_score > 0:
-        return 'work'
-    else:
-        # Default: check path
-        if '/apple notes/' in path_str:
-            return 'personal'
-        return 'work'
+    return 'work'
 
 
-def get_work_category(filepath, content):
-    """Determine work subcategory."""
-    name = filepath.name.lower()
-    path_str = str(filepath).lower()
-    content_lower = (content or '').lower()[:3000]
-    
+def get_work_category(name, path_str, content):
+    """Determine work subcategory (same inputs as classify_content)."""
     # Path-based categorization
     if '/1 on 1/' in path_str or '/1on1/' in path_str:
         return 'people'
@@ -185,7 +313,7 @@ def get_work_category(filepath, content):
     # Content-based
     if '1:1' in name or ' <> ' in name or ' / ' in name:
         return 'people'
-    if 'incident' in name or 'outage' in name or 'rca' in content_lower:
+    if 'incident' in name or 'outage' in name or 'rca' in content[:3000].lower():
         return 'incidents'
     if 'interview' in name or 'candidate' in name:
         return 'interviews'
@@ -193,11 +321,8 @@ def get_work_category(filepath, content):
     return 'reference'
 
 
-def get_personal_category(filepath, content):
-    """Determine personal subcategory."""
-    name = filepath.name.lower()
-    path_str = str(filepath).lower()
-    
+def get_personal_category(name, path_str):
+    """Determine personal subcategory from the lowercased filename and path."""
     if '/health/' in path_str or 'retinal' in name or 'medical' in name:
         return 'health'
     if '/canada/' in path_str or 'pr card' in name or 'immigration' in name:
@@ -216,58 +341,72 @@ def get_personal_category(filepath, content):
 
 def extract_person_from_filename(filename):
     """Extract person name from 1:1 filename."""
-    # Patterns: "Person <> Arnab", "Person / Arnab", etc.
-    patterns = [
-        r'^(.+?)\s*<>\s*Arnab',
-        r'^(.+?)\s*/\s*Arnab',
-        r'^Arnab\s*<>\s*(.+)',
-        r'^Arnab\s*/\s*(.+)',
-    ]
-    
     name = filename.replace('.md', '')
-    for pattern in patterns:
-        match = re.match(pattern, name, re.IGNORECASE)
-        if match:
-            person = match.group(1).strip()
-            # Remove date suffixes
-            person = re.sub(r'\s*[-–]\s*\d+.*$', '', person)
-            return person
+    match = PERSON_RE.match(name)
+    if match:
+        person = match.group(match.lastgroup).strip()
+        # Remove date suffixes
+        return PERSON_DATE_SUFFIX_RE.sub('', person)
+    return None
+
+
+def _fast_iso(name):
+    """Return the leftmost YYYY-MM-DD in name using string scans, or None."""
+    j = name.find('-', 4)
+    while j != -1 and j + 6 <= len(name):
+        if (name[j - 4:j].isdecimal() and name[j + 3] == '-'
+                and name[j + 1:j + 3].isdecimal() and name[j + 4:j + 6].isdecimal()):
+            return name[j - 4:j + 6]
+        j = name.find('-', j + 1)
     return None
 
 
 def extract_date_from_filename(filename):
     """Try to extract date from filename."""
-    # Try various date patterns
-    patterns = [
-        r'(\d{1,2})(?:st|nd|rd|th)?\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s*(\d{2,4})',
-        r'(\d{4})-(\d{2})-(\d{2})',
-        r'(\d{1,2})/(\d{1,2})/(\d{2,4})',
-    ]
+    # Fast path for ISO dates. "1st May 25" style dates take priority and
+    # need month letters, so it only applies when the stem has no cased letters.
+    stem = filename[:-3] if filename.endswith('.md') else filename
+    if stem.lower() == stem.upper():
+        iso = _fast_iso(stem)
+        if iso:
+            return iso
+    
+    match = DATE_RE.match(filename)
+    if not match:
+        return None
     
-    months = {'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04', 'may': '05', 'jun': '06',
-              'jul': '07', 'aug': '08', 'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'}
-    
-    for pattern in patterns:
-        match = re.search(pattern, filename, re.IGNORECASE)
-        if match:
-            groups = match.groups()
-            if len(groups) == 3:
-                if groups[1].lower()[:3] in months:
-                    # Format: "1st May 25"
-                    day = groups[0].zfill(2)
-                    month = months[groups[1].lower()[:3]]
-                    year = groups[2]
-                    if len(year) == 2:
-                        year = '20' + year
-                    return f"{year}-{month}-{day}"
-                else:
-                    # Try YYYY-MM-DD or similar
-                    try:
-                        return f"{groups[0]}-{groups[1].zfill(2)}-{groups[2].zfill(2)}"
-                    except:
-                        pass
+    kind = match.lastgroup
+    if kind == 'dmy':
+        # Format: "1st May 25"
+        day, month, year = match.group(2, 3, 4)
+        if month.lower()[:3] not in MONTHS:
+            # Case-insensitive match on a non-ASCII letter (e.g. "ſep")
+            return f"{day}-{month.zfill(2)}-{year.zfill(2)}"
+        if len(year) == 2:
+            year = '20' + year
+        return f"{year}-{MONTHS[month.lower()[:3]]}-{day.zfill(2)}"
     
-    return None
+    # YYYY-MM-DD or D/M/Y, fields kept in filename order
+    first = 6 if kind == 'iso' else 10
+    a, b, c = match.group(first, first + 1, first + 2)
+    return f"{a}-{b.zfill(2)}-{c.zfill(2)}"
+
+
+def get_output_names(output_dir):
+    """Return the set of taken names in output_dir, scanning it on first use."""
+    names = WRITTEN.get(output_dir)
+    if names is None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with os.scandir(output_dir) as it:
+            names = WRITTEN[output_dir] = {entry.name for entry in it}
+    return names
+
+
+def write_new_file(output_path, text):
+    """Create output_path and write text; raises FileExistsError if it already exists."""
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    with open(fd, 'wb') as f:
+        f.write(text.encode('utf-8'))
 
 
 def add_frontmatter(content, metadata):
@@ -276,49 +415,62 @@ def add_frontmatter(content, metadata):
         # Already has frontmatter, skip
         return content
     
-    fm_lines = ['---']
+    output = io.StringIO()
+    output.write('---\n')
     for key, value in metadata.items():
         if value:
             if isinstance(value, list):
-                fm_lines.append(f'{key}: {value}')
+                output.write(f'{key}: {value}\n')
             else:
-                fm_lines.append(f'{key}: "{value}"')
-    fm_lines.append('---\n')
+                output.write(f'{key}: "{value}"\n')
+    output.write('---\n')
+    output.write(content)
     
-    return '\n'.join(fm_lines) + content
+    return output.getvalue()
 
 
-def process_file(filepath):
-    """Process a single file."""
+def prepare_file(filepath):
+    """Read and classify a file and build its output content.
+    
+    Safe to run in worker threads: the only shared state is KEYWORD_CACHE,
+    whose single dict gets/sets are atomic under the GIL, and a racing
+    duplicate just computes and stores the same winner twice. Returns
+    (outcome, category, output_dir, output_name, stem_slug, final_content);
+    outcome is 'skipped_pattern', 'read_error', 'skip', 'personal' or 'work'.
+    """
     if should_skip(filepath):
-        stats['skipped_pattern'] += 1
-        return
+        return ('skipped_pattern', None, None, None, None, None)
     
     content = get_file_content(filepath)
     if content is None:
-        stats['read_error'] += 1
-        return
+        return ('read_error', None, None, None, None, None)
+    
+    # Per-file strings shared by classification, categorization and naming
+    stem = filepath.stem
+    stem_slug = slugify(stem)
+    name_lower = filepath.name.lower()
+    path_lower = str(filepath).lower()
     
-    classification = classify_content(filepath, content)
+    classification = classify_content(name_lower, path_lower, content)
     
     if classification == 'skip':
-        stats['skipped_content'] += 1
-        skipped_files.append(str(filepath))
-        return
+        return ('skip', None, None, None, None, None)
+    
+    rel_source = str(filepath.relative_to(VAULT_PATH))
     
     if classification == 'personal':
-        category = get_personal_category(filepath, content)
+        category = get_personal_category(name_lower, path_lower)
         output_dir = PERSONAL_PATH / category
-        output_name = slugify(filepath.stem) + '.md'
+        output_name = stem_slug + '.md'
         
         metadata = {
-            'title': filepath.stem,
+            'title': stem,
             'category': category,
-            'source': str(filepath.relative_to(VAULT_PATH)),
+            'source': rel_source,
         }
         
     else:  # work
-        category = get_work_category(filepath, content)
+        category = get_work_category(name_lower, path_lower, content)
         
         if category == 'people':
             person = extract_person_from_filename(filepath.name)
@@ -326,14 +478,12 @@ def process_file(filepath):
                 person_slug = slugify(person)
                 date = extract_date_from_filename(filepath.name) or 'undated'
                 output_dir = ORGANIZED_PATH / 'people' / person_slug
-                output_name = f"{date}-{slugify(filepath.stem)}.md"
+                output_name = f"{date}-{stem_slug}.md"
             else:
                 output_dir = ORGANIZED_PATH / 'people' / 'misc'
-                output_name = slugify(filepath.stem) + '.md'
+                output_name = stem_slug + '.md'
         elif category == 'projects':
             # Determine project
-            name_lower = filepath.name.lower()
-            path_lower = str(filepath).lower()
             if 'polaris' in name_lower or 'polaris' in path_lower:
                 output_dir = ORGANIZED_PATH / 'projects' / 'polaris'
             elif 'lakehouse' in name_lower or 'lakehouse' in path_lower:
@@ -348,44 +498,65 @@ def process_file(filepath):
                 output_dir = ORGANIZED_PATH / 'projects' / 'ai-observability'
             else:
                 output_dir = ORGANIZED_PATH / 'projects' / 'other'
-            output_name = slugify(filepath.stem) + '.md'
+            output_name = stem_slug + '.md'
         elif category == 'reviews':
             output_dir = ORGANIZED_PATH / 'reviews'
-            output_name = slugify(filepath.stem) + '.md'
+            output_name = stem_slug + '.md'
         elif category == 'learning':
             output_dir = ORGANIZED_PATH / 'learning'
-            output_name = slugify(filepath.stem) + '.md'
+            output_name = stem_slug + '.md'
         else:
             output_dir = ORGANIZED_PATH / category
-            output_name = slugify(filepath.stem) + '.md'
+            output_name = stem_slug + '.md'
         
         metadata = {
-            'title': filepath.stem,
+            'title': stem,
             'category': category,
-            'source': str(filepath.relative_to(VAULT_PATH)),
+            'source': rel_source,
         }
         
         date = extract_date_from_filename(filepath.name)
         if date:
             metadata['date'] = date
     
-    # Add frontmatter and write
+    # Add frontmatter
     final_content = add_frontmatter(content, metadata)
     
-    output_dir.mkdir(parents=True, exist_ok=True)
-    output_path = output_dir / output_name
+    return (classification, category, output_dir, output_name, stem_slug, final_content)
+
+
+def process_file(filepath, prepared=None):
+    """Process a single file; prepared is prepare_file's result if already computed."""
+    if prepared is None:
+        prepared = prepare_file(filepath)
+    classification, category, output_dir, output_name, stem_slug, final_content = prepared
+    
+    if classification in ('skipped_pattern', 'read_error'):
+        stats[classification] += 1
+        return
     
-    # Handle duplicates
+    if classification == 'skip':
+        stats['skipped_content'] += 1
+        skipped_files.append(str(filepath))
+        return
+    
+    # Handle duplicates: probe the in-memory name set, O_EXCL catches anything else
+    taken = get_output_names(output_dir)
     counter = 1
-    while output_path.exists():
-        output_name = f"{slugify(filepath.stem)}-{counter}.md"
-        output_path = output_dir / output_name
+    while True:
+        if output_name not in taken:
+            taken.add(output_name)
+            try:
+                write_new_file(output_dir / output_name, final_content)
+                break
+            except FileExistsError:
+                pass
+        output_name = f"{stem_slug}-{counter}.md"
         counter += 1
-    
-    output_path.write_text(final_content, encoding='utf-8')
+    output_path = output_dir / output_name
     
     stats[classification] += 1
-    stats[f'{classification}_{category}'] += 1
+    category_stats[classification][category] += 1
     processed_files.append({
         'source': str(filepath),
         'dest': str(output_path),
@@ -394,16 +565,30 @@ def process_file(filepath):
     })
 
 
+def collect_markdown_files(dirpath, paths):
+    """Append all markdown files under a directory to paths, in walk order."""
+    # scandir entries carry the dirent type, so only .md files become Path objects
+    with os.scandir(dirpath) as it:
+        for entry in it:
+            if entry.is_dir():
+                # Skip certain directories
+                if entry.name in SKIP_DIRS:
+                    continue
+                collect_markdown_files(entry.path, paths)
+            elif entry.name.endswith('.md') and entry.name != '.md':
+                paths.append(Path(entry.path))
+
+
 def process_directory(dirpath):
     """Process all markdown files in a directory."""
-    for item in dirpath.iterdir():
-        if item.is_dir():
-            # Skip certain directories
-            if item.name in ['Media', '.obsidian', '.trash']:
-                continue
-            process_directory(item)
-        elif item.suffix == '.md':
-            process_file(item)
+    paths = []
+    collect_markdown_files(dirpath, paths)
+    
+    # Reads and classification run in the pool; results are consumed in walk
+    # order on this thread, so stats and duplicate naming stay deterministic
+    with ThreadPoolExecutor(max_workers=FILE_WORKERS) as executor:
+        for filepath, prepared in zip(paths, executor.map(prepare_file, paths)):
+            process_file(filepath, prepared)
 
 
 def main():
@@ -441,21 +626,20 @@ def main():
     print()
     
     print("=== Work breakdown ===")
-    for key, val in sorted(stats.items()):
-        if key.startswith('work_'):
-            print(f"  {key.replace('work_', '')}: {val}")
+    for key, val in sorted(category_stats['work'].items()):
+        print(f"  {key}: {val}")
     
     print()
     print("=== Personal breakdown ===")
-    for key, val in sorted(stats.items()):
-        if key.startswith('personal_'):
-            print(f"  {key.replace('personal_', '')}: {val}")
+    for key, val in sorted(category_stats['personal'].items()):
+        print(f"  {key}: {val}")
     
     # Save processing log
     log_path = Path("/home/Arnab/clawd/projects/career-agent/analysis/remaining_processing.log")
     with open(log_path, 'w') as f:
         f.write(f"Processed: {datetime.now().isoformat()}\n\n")
-        f.write(f"Stats: {dict(stats)}\n\n")
+        f.write(f"Stats: {dict(stats)}\n")
+        f.write(f"Categories: { {key: dict(val) for key, val in category_stats.items()} }\n\n")
         f.write("Skipped files:\n")
         for sf in skipped_files[:50]:
             f.write(f"  {sf}\n")
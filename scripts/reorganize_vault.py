@@ -3,29 +3,42 @@
 Reorganize Granola meeting notes into a structured folder hierarchy.
 """
 
+import io
 import os
 import re
 import json
+import functools
 import shutil
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
 
+# Optional ijson (streaming parser) to read meetings one at a time
+try:
+    import ijson
+    IJSON_ENABLED = True
+except ImportError:
+    ijson = None
+    IJSON_ENABLED = False
+
 VAULT_PATH = Path("/home/Arnab/clawd/projects/career-agent/obsidian/vault")
 OUTPUT_PATH = Path("/home/Arnab/clawd/projects/career-agent/obsidian/organized")
+OUTPUT_PATH_STR = str(OUTPUT_PATH)
 ANALYSIS_PATH = Path("/home/Arnab/clawd/projects/career-agent/analysis")
+ANALYSIS_FILE = ANALYSIS_PATH / "meetings_analysis.json"
+
+# slugify: drop punctuation, then collapse whitespace/underscore/hyphen runs to one '-'
+SLUG_DROP_RE = re.compile(r'[^\w\s-]+')
+SLUG_SEPARATOR_RE = re.compile(r'[\s_-]+')
 
-# Load analysis
-with open(ANALYSIS_PATH / "meetings_analysis.json") as f:
-    analysis = json.load(f)
+# Meeting sections in a source file start at each "## " header
+SECTION_SPLIT_RE = re.compile(r'\n(?=## )')
 
 
 def slugify(text):
     """Convert text to a safe filename slug."""
-    text = text.lower()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[\s_]+', '-', text)
-    text = re.sub(r'-+', '-', text)
+    text = SLUG_DROP_RE.sub('', text.lower())
+    text = SLUG_SEPARATOR_RE.sub('-', text)
     return text.strip('-')[:50]
 
 
@@ -72,56 +85,77 @@ def extract_person_from_1on1(title):
 
 
 def get_output_path(meeting):
-    """Determine the output path for a meeting."""
+    """Determine the output path (a str) for a meeting."""
     category = meeting.get('category', 'other')
     title = meeting.get('title', 'untitled')
     date = extract_date_from_meeting(meeting)
+    title_lower = title.lower()
+    dated_name = f"{date}-{slugify(title)}.md"
     
     if category == '1on1':
         person = extract_person_from_1on1(title)
         if person:
             person_slug = slugify(person)
-            return OUTPUT_PATH / 'people' / person_slug / f"{date}-{slugify(title)}.md"
+            return os.path.join(OUTPUT_PATH_STR, 'people', person_slug, dated_name)
     
     elif category == 'daily_standup':
-        if 'metastore' in title.lower():
-            return OUTPUT_PATH / 'team' / 'metastore-daily' / f"{date}.md"
-        elif 'lakehouse' in title.lower() or 'mdlh' in title.lower():
-            return OUTPUT_PATH / 'team' / 'lakehouse-daily' / f"{date}.md"
+        if 'metastore' in title_lower:
+            return os.path.join(OUTPUT_PATH_STR, 'team', 'metastore-daily', f"{date}.md")
+        elif 'lakehouse' in title_lower or 'mdlh' in title_lower:
+            return os.path.join(OUTPUT_PATH_STR, 'team', 'lakehouse-daily', f"{date}.md")
         else:
-            return OUTPUT_PATH / 'team' / 'standups' / f"{date}-{slugify(title)}.md"
+            return os.path.join(OUTPUT_PATH_STR, 'team', 'standups', dated_name)
     
     elif category == 'weekly':
-        return OUTPUT_PATH / 'team' / 'weekly' / f"{date}-{slugify(title)}.md"
+        return os.path.join(OUTPUT_PATH_STR, 'team', 'weekly', dated_name)
     
     elif category == 'project':
         # Determine which project
-        title_lower = title.lower()
         if 'bedrock' in title_lower:
-            return OUTPUT_PATH / 'projects' / 'bedrock' / f"{date}-{slugify(title)}.md"
+            return os.path.join(OUTPUT_PATH_STR, 'projects', 'bedrock', dated_name)
         elif 'lean' in title_lower or 'graph' in title_lower:
-            return OUTPUT_PATH / 'projects' / 'lean-graph' / f"{date}-{slugify(title)}.md"
+            return os.path.join(OUTPUT_PATH_STR, 'projects', 'lean-graph', dated_name)
         elif 'polaris' in title_lower:
-            return OUTPUT_PATH / 'projects' / 'polaris' / f"{date}-{slugify(title)}.md"
+            return os.path.join(OUTPUT_PATH_STR, 'projects', 'polaris', dated_name)
         elif 'migration' in title_lower:
-            return OUTPUT_PATH / 'projects' / 'migrations' / f"{date}-{slugify(title)}.md"
+            return os.path.join(OUTPUT_PATH_STR, 'projects', 'migrations', dated_name)
         else:
-            return OUTPUT_PATH / 'projects' / 'other' / f"{date}-{slugify(title)}.md"
+            return os.path.join(OUTPUT_PATH_STR, 'projects', 'other', dated_name)
     
     elif category == 'interview':
-        return OUTPUT_PATH / 'interviews' / f"{date}-{slugify(title)}.md"
+        return os.path.join(OUTPUT_PATH_STR, 'interviews', dated_name)
     
     elif category == 'incident':
-        return OUTPUT_PATH / 'incidents' / f"{date}-{slugify(title)}.md"
+        return os.path.join(OUTPUT_PATH_STR, 'incidents', dated_name)
     
     elif category == 'cross_team':
-        return OUTPUT_PATH / 'cross-team' / f"{date}-{slugify(title)}.md"
+        return os.path.join(OUTPUT_PATH_STR, 'cross-team', dated_name)
     
     elif category == 'cost_review':
-        return OUTPUT_PATH / 'projects' / 'cost-optimization' / f"{date}-{slugify(title)}.md"
+        return os.path.join(OUTPUT_PATH_STR, 'projects', 'cost-optimization', dated_name)
     
     # Default: other
-    return OUTPUT_PATH / 'other' / f"{date}-{slugify(title)}.md"
+    return os.path.join(OUTPUT_PATH_STR, 'other', dated_name)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_sections(source_file):
+    """Read a source file once and split it into (title, section) pairs.
+    
+    Daily files hold many meetings, so this is cached per source file
+    instead of re-reading and re-splitting the file for every meeting.
+    """
+    with open(source_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    sections = []
+    for section in SECTION_SPLIT_RE.split(content):
+        if not section:
+            continue
+        first_line = section.split('\n', 1)[0]
+        sections.append((first_line.lstrip('#').strip(), section))
+    
+    return content, tuple(sections)
 
 
 def read_meeting_content(meeting):
@@ -133,23 +167,12 @@ def read_meeting_content(meeting):
         return None
     
     try:
-        with open(source_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content, sections = _parse_sections(source_file)
     except:
         return None
     
     # Find this meeting's section in the file
-    # Split by ## headers and find the matching section
-    sections = re.split(r'\n(?=## )', content)
-    
-    for section in sections:
-        if not section:
-            continue
-        # Get first line properly
-        lines = section.split('\n')
-        first_line = lines[0] if lines else ''
-        section_title = first_line.lstrip('#').strip()
-        
+    for section_title, section in sections:
         if section_title == title:
             return section
         
@@ -172,36 +195,58 @@ def add_frontmatter(content, meeting):
     """Add YAML frontmatter to meeting content."""
     date = extract_date_from_meeting(meeting)
     
-    frontmatter = [
-        "---",
-        f"title: \"{meeting.get('title', 'Untitled')}\"",
-        f"date: {date}",
-        f"category: {meeting.get('category', 'other')}",
-    ]
+    output = io.StringIO()
+    output.write("---\n")
+    output.write(f"title: \"{meeting.get('title', 'Untitled')}\"\n")
+    output.write(f"date: {date}\n")
+    output.write(f"category: {meeting.get('category', 'other')}\n")
     
     if meeting.get('people'):
         people_list = ', '.join(f'"{p}"' for p in meeting['people'][:10])
-        frontmatter.append(f"people: [{people_list}]")
+        output.write(f"people: [{people_list}]\n")
     
     if meeting.get('projects'):
         projects_list = ', '.join(f'"{p}"' for p in meeting['projects'])
-        frontmatter.append(f"projects: [{projects_list}]")
+        output.write(f"projects: [{projects_list}]\n")
     
     if meeting.get('granola_id'):
-        frontmatter.append(f"granola_id: {meeting['granola_id']}")
+        output.write(f"granola_id: {meeting['granola_id']}\n")
     
     if meeting.get('transcript_link'):
-        frontmatter.append(f"transcript: {meeting['transcript_link']}")
+        output.write(f"transcript: {meeting['transcript_link']}\n")
     
-    frontmatter.append("---\n")
+    output.write("---\n")
+    output.write(content)
     
-    return '\n'.join(frontmatter) + content
+    return output.getvalue()
+
+
+def _stream_meetings():
+    with open(ANALYSIS_FILE, 'rb') as f:
+        yield from ijson.items(f, 'meetings.item', use_float=True)
+
+
+def load_meetings():
+    """Return (meeting count, iterator over meetings) from the analysis file.
+    
+    With ijson the meetings are parsed lazily, one dict at a time, instead of
+    holding the whole analysis in memory. "total" precedes "meetings" in the
+    file, so reading the count only parses the header.
+    """
+    if IJSON_ENABLED:
+        with open(ANALYSIS_FILE, 'rb') as f:
+            total = next(ijson.items(f, 'total'), 0)
+        return total, _stream_meetings()
+    
+    with open(ANALYSIS_FILE) as f:
+        meetings = json.load(f)['meetings']
+    return len(meetings), iter(meetings)
 
 
 def reorganize():
     """Main reorganization function."""
-    meetings = analysis['meetings']
-    print(f"Processing {len(meetings)} meetings...")
+    total, meetings = load_meetings()
+    print(f"Processing {total} meetings...")
     
     # Create output directories
     OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
@@ -224,7 +269,7 @@ def reorganize():
             final_content = add_frontmatter(content, meeting)
             
             # Write file
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
             with open(output_path, 'w', encoding='utf-8') as f:
                 f.write(final_content)
             
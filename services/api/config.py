@@ -44,10 +44,12 @@ class Settings(BaseSettings):
     # Indexing
     chunk_size: int = 500
     chunk_overlap: int = 50
+    indexer_workers: int = 0  # Thread pool size for file I/O/hashing/chunking; 0 = cpu_count - 1
     
     # Search
     default_search_limit: int = 10
     similarity_threshold: float = 0.7
+    embedding_hedge_delay: float = 0.5  # Seconds before a slow query embedding is retried in parallel; 0 disables
     
     # RAG
     max_context_chunks: int = 5
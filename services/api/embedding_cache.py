@@ -0,0 +1,103 @@
+"""
+Embedding Cache - persistent SQLite store of embedding vectors for note-rag
+
+Vectors are keyed by (content hash, model), so unchanged chunks are never
+re-embedded across restarts and switching embedding models invalidates
+old entries automatically.
+"""
+
+import sqlite3
+import logging
+import hashlib
+from array import array
+from pathlib import Path
+from typing import List, Dict, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Stay well under SQLite's bound-parameter limit (999 on older builds)
+_LOOKUP_BATCH = 500
+
+
+def content_hash(text: str) -> str:
+    """Hash text for cache lookups (128-bit BLAKE2b, hex)."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite-backed (hash, model) -> float32 vector cache."""
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        
+        # Ensure parent directory exists
+        parent_dir = Path(db_path).parent
+        if not parent_dir.exists():
+            try:
+                parent_dir.mkdir(parents=True, exist_ok=True)
+            except Exception as e:
+                logger.warning(f"Could not create embedding cache directory {parent_dir}: {e}")
+                self.db_path = "/tmp/embedding_cache.db"
+        
+        try:
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._init_tables()
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Could not open embedding cache at {self.db_path}: {e}, trying /tmp")
+            self.db_path = "/tmp/embedding_cache.db"
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._init_tables()
+    
+    def _init_tables(self):
+        """Create the cache table if not exists."""
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                hash TEXT NOT NULL,
+                model TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                PRIMARY KEY (hash, model)
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+        logger.info(f"Embedding cache initialized at {self.db_path}")
+    
+    def get_many(self, hashes: List[str], model: str) -> Dict[str, List[float]]:
+        """Look up cached vectors; returns {hash: vector} for the hits only."""
+        found = {}
+        unique = list(dict.fromkeys(hashes))
+        
+        try:
+            for start in range(0, len(unique), _LOOKUP_BATCH):
+                batch = unique[start:start + _LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self.conn.execute(
+                    f"SELECT hash, vector FROM embedding_cache WHERE model = ? AND hash IN ({placeholders})",
+                    [model, *batch]
+                )
+                for h, blob in rows:
+                    vec = array("f")
+                    vec.frombytes(blob)
+                    found[h] = vec.tolist()
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+        
+        return found
+    
+    def put_many(self, items: Iterable[Tuple[str, List[float]]], model: str):
+        """Store (hash, vector) pairs; existing entries are left as they are."""
+        try:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO embedding_cache (hash, model, vector) VALUES (?, ?, ?)",
+                [(h, model, array("f", vec).tobytes()) for h, vec in items]
+            )
+            self.conn.commit()
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+    
+    def count(self) -> int:
+        """Number of cached vectors (all models)."""
+        return self.conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+    
+    def close(self):
+        """Close database connection."""
+        self.conn.close()
@@ -0,0 +1,166 @@
+"""
+Fast Frontmatter - parser for the simple YAML frontmatter found in notes
+
+Handles flat `key: value` headers with plain/quoted scalars, flow lists
+(`[a, b]`) and block lists (`- a`). Anything else (nested mappings,
+multi-line strings, anchors, tags, exotic scalars) falls back to
+python-frontmatter, so the result always matches frontmatter.loads.
+"""
+
+import re
+from datetime import date
+from typing import Any, Dict, List, Tuple
+
+import frontmatter
+from yaml.resolver import Resolver
+
+# Same boundary python-frontmatter's YAML handler splits on
+FM_BOUNDARY = re.compile(r"^-{3,}\s*$", re.MULTILINE)
+
+KEY_RE = re.compile(r"([A-Za-z_][\w-]*):(?: +(.*))?$")
+ITEM_RE = re.compile(r"( *)-(?:[ \t]+(.*?))?[ \t]*$")
+SIMPLE_INT_RE = re.compile(r"[-+]?(?:0|[1-9][0-9]*)$")
+SIMPLE_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})$")
+# Characters YAML refuses to load
+NON_PRINTABLE_RE = re.compile("[^\x09\x0A\x0D\x20-\x7E\x85\xA0-\uD7FF\uE000-\uFFFD\U00010000-\U0010FFFF]")
+
+# First characters that give a plain scalar special meaning in YAML
+PLAIN_UNSAFE_START = frozenset("[]{}&*!|>'\"%@`#,?:-")
+
+BOOL_TRUE = frozenset(["yes", "Yes", "YES", "true", "True", "TRUE", "on", "On", "ON"])
+
+# PyYAML's implicit resolvers (what makes `2024-01-05` a date, `yes` a bool, ...)
+IMPLICIT_RESOLVERS = Resolver.yaml_implicit_resolvers
+
+
+class _SlowPath(Exception):
+    """Header uses YAML beyond what this parser handles."""
+
+
+def _plain_scalar(value: str) -> Any:
+    """Resolve an unquoted scalar the way yaml.SafeLoader would, or raise _SlowPath."""
+    if not value:
+        return None
+    if value[0] in PLAIN_UNSAFE_START or ": " in value or " #" in value or value.endswith(":"):
+        raise _SlowPath
+    
+    # Plain dates are the most common typed value in notes
+    match = SIMPLE_DATE_RE.match(value)
+    if match:
+        try:
+            return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        except ValueError:
+            raise _SlowPath
+    
+    for tag, regexp in IMPLICIT_RESOLVERS.get(value[0], ()):
+        if not regexp.match(value):
+            continue
+        if tag.endswith(":null"):
+            return None
+        if tag.endswith(":bool"):
+            return value in BOOL_TRUE
+        if tag.endswith(":int") and SIMPLE_INT_RE.match(value):
+            return int(value)
+        raise _SlowPath  # floats, octal/hex/sexagesimal ints, datetimes, merge keys
+    return value
+
+
+def _scalar(value: str) -> Any:
+    """Resolve a plain or simply-quoted scalar."""
+    if value[:1] == "'":
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != "'" or "'" in inner.replace("''", ""):
+            raise _SlowPath
+        return inner.replace("''", "'")
+    if value[:1] == '"':
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != '"' or '"' in inner or "\\" in inner:
+            raise _SlowPath
+        return inner
+    return _plain_scalar(value)
+
+
+def _flow_list(value: str) -> List[Any]:
+    """Parse a one-line `[a, b, c]` list of scalars."""
+    inner = value[1:-1]
+    if value[-1] != "]" or any(c in inner for c in "[]{}'\"#"):
+        raise _SlowPath
+    if not inner.strip():
+        return []
+    items = [item.strip() for item in inner.split(",")]
+    if not items[-1]:
+        items.pop()  # Trailing comma
+    if not all(items):
+        raise _SlowPath
+    return [_plain_scalar(item) for item in items]
+
+
+def _value(value: str) -> Any:
+    if value[:1] == "[":
+        return _flow_list(value)
+    return _scalar(value)
+
+
+def _parse_header(header: str) -> Dict[str, Any]:
+    """Parse a flat YAML mapping, or raise _SlowPath."""
+    if "\t" in header or NON_PRINTABLE_RE.search(header):
+        raise _SlowPath
+    data: Dict[str, Any] = {}
+    list_key = None  # Key whose block list is being read
+    list_indent = None
+    
+    for line in header.split("\n"):
+        stripped = line.strip()
+        if not stripped or stripped[0] == "#":
+            continue
+        
+        item = ITEM_RE.match(line) if list_key is not None else None
+        if item:
+            items = data[list_key]
+            if items is None:
+                items = data[list_key] = []
+                list_indent = item.group(1)
+            elif item.group(1) != list_indent:
+                raise _SlowPath
+            items.append(_scalar(item.group(2) or ""))
+            continue
+        
+        if line[0] == " ":
+            raise _SlowPath  # Nested mapping or multi-line scalar
+        match = KEY_RE.match(line)
+        if not match:
+            raise _SlowPath
+        key, value = match.group(1), (match.group(2) or "").rstrip(" ")
+        if key in ("null", "Null", "NULL", "true", "True", "TRUE", "false", "False", "FALSE",
+                   "yes", "Yes", "YES", "no", "No", "NO", "on", "On", "ON", "off", "Off", "OFF"):
+            raise _SlowPath  # Key would not resolve to a string
+        if value:
+            data[key] = _value(value)
+            list_key = None
+        else:
+            data[key] = None
+            list_key = key
+    return data
+
+
+def parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
+    """
+    Split content into (metadata, body), same result as frontmatter.loads.
+    
+    Raises whatever frontmatter.loads raises for malformed YAML.
+    """
+    text = content.strip()
+    if text[:3] == "---" and FM_BOUNDARY.match(text):
+        try:
+            _, header, body = FM_BOUNDARY.split(text, 2)
+        except ValueError:
+            return {}, text  # No closing delimiter
+        try:
+            return _parse_header(header), body.strip()
+        except _SlowPath:
+            pass
+    elif text[:1] != "{":
+        return {}, text  # No frontmatter (a leading "{" may be JSON frontmatter)
+    
+    post = frontmatter.loads(content)
+    return post.metadata, post.content
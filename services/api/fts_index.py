@@ -112,7 +112,7 @@ class FTSIndex:
         date: str = None
     ) -> bool:
         """Insert or update a document in the FTS index."""
-        file_hash = hashlib.md5(content.encode()).hexdigest()
+        file_hash = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
         people_str = ", ".join(people or [])
         
         try:
@@ -179,7 +179,8 @@ class FTSIndex:
         limit: int = 30,
         person: Optional[str] = None,
         date_from: Optional[str] = None,
-        date_to: Optional[str] = None
+        date_to: Optional[str] = None,
+        exclude_paths: Optional[List[str]] = None
     ) -> List[Dict]:
         """
         BM25 full-text search.
@@ -191,10 +192,11 @@ class FTSIndex:
             person: Filter by person name (partial match)
             date_from: Start date filter (YYYY-MM-DD format, inclusive)
             date_to: End date filter (YYYY-MM-DD format, inclusive)
+            exclude_paths: Skip files whose path contains any of these substrings
         
         Returns list of results with:
         - file_path, title, vault, category, people, date
-        - snippet: highlighted excerpt
+        - snippet: highlighted excerpt (also as excerpt, matching vector results)
         - score: BM25 relevance score (higher = better)
         """
         # Escape query for FTS5 syntax
@@ -221,6 +223,11 @@ class FTSIndex:
             where_parts.append("d.date <= ?")
             params.append(date_to)
         
+        # Excluded folders (case-sensitive substring, unlike LIKE)
+        for excluded in exclude_paths or []:
+            where_parts.append("instr(d.file_path, ?) = 0")
+            params.append(excluded)
+        
         where_clause = " AND ".join(where_parts)
         params.append(limit)
         
@@ -252,6 +259,7 @@ class FTSIndex:
                     "people": row["people"].split(", ") if row["people"] else [],
                     "date": row["date"],
                     "snippet": row["snippet"],
+                    "excerpt": row["snippet"],
                     "score": abs(row["score"]),  # BM25 returns negative scores
                     "source": "bm25"
                 })
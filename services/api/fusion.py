@@ -7,7 +7,9 @@ Implements the RRF algorithm used by QMD for hybrid search:
 - Supports top-rank bonuses
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from operator import itemgetter
+import heapq
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,12 +20,15 @@ def reciprocal_rank_fusion(
     k: int = 60,
     id_key: str = "file_path",
     score_key: str = "score",
-    top_rank_bonus: bool = True
+    top_rank_bonus: bool = True,
+    top_k: Optional[int] = None,
+    max_rank: Optional[int] = None,
+    weights: Optional[List[float]] = None
 ) -> List[Dict]:
     """
     Combine multiple ranked result lists using Reciprocal Rank Fusion.
     
-    RRF score = Σ 1/(k + rank + 1) for each list the document appears in
+    RRF score = Σ weight/(k + rank + 1) for each list the document appears in
     
     Args:
         result_lists: List of ranked result lists (each result is a dict)
@@ -31,18 +36,36 @@ def reciprocal_rank_fusion(
         id_key: Key to use for document identity
         score_key: Key to store the fused score
         top_rank_bonus: Add bonus for documents that rank #1 in any list
+        top_k: Only return the best top_k documents (partial selection
+            instead of a full sort)
+        max_rank: Expected list length; sizes the precomputed 1/(k + rank + 1)
+            table (defaults to the longest list, deeper ranks are computed)
+        weights: Per-list weight on RRF contributions (default 1.0 each);
+            a weight of 2.0 is the same as passing that list twice
     
     Returns:
-        Fused result list sorted by combined score
+        Fused result list sorted by combined score. The returned dicts are
+        fresh copies; input dicts are never mutated, but must not be mutated
+        concurrently while fusion runs.
     """
     if not result_lists:
         return []
+    if weights is not None and len(weights) != len(result_lists):
+        raise ValueError(f"Got {len(weights)} weights for {len(result_lists)} result lists")
     
     scores: Dict[str, float] = {}
     docs: Dict[str, Dict] = {}
     top_ranks: Dict[str, int] = {}  # Track best rank achieved
     
+    # Reciprocal rank lookup table, shared by every list
+    if max_rank is None:
+        max_rank = max(len(results) for results in result_lists)
+    rank_recip = [1.0 / (k + rank + 1) for rank in range(max_rank)]
+    
     for list_idx, results in enumerate(result_lists):
+        weight = weights[list_idx] if weights is not None else 1.0
+        list_recip = rank_recip if weight == 1.0 else [weight * recip for recip in rank_recip]
+        
         for rank, doc in enumerate(results):
             doc_id = doc.get(id_key)
             if not doc_id:
@@ -51,11 +74,11 @@ def reciprocal_rank_fusion(
             # Initialize if first time seeing this doc
             if doc_id not in scores:
                 scores[doc_id] = 0.0
-                docs[doc_id] = doc.copy()
+                docs[doc_id] = doc
                 top_ranks[doc_id] = rank
             
             # RRF contribution
-            scores[doc_id] += 1.0 / (k + rank + 1)
+            scores[doc_id] += list_recip[rank] if rank < max_rank else weight * (1.0 / (k + rank + 1))
             
             # Track best rank
             if rank < top_ranks[doc_id]:
@@ -69,16 +92,17 @@ def reciprocal_rank_fusion(
             elif best_rank <= 2:
                 scores[doc_id] += 0.02  # Top 3 bonus
     
-    # Sort by fused score
-    sorted_docs = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+    # Sort by fused score (heap selection when only the top_k are needed)
+    if top_k is None:
+        sorted_docs = sorted(scores.items(), key=itemgetter(1), reverse=True)
+    else:
+        sorted_docs = heapq.nlargest(top_k, scores.items(), key=itemgetter(1))
     
-    # Build result list with fused scores
+    # Build result list with fused scores (one shallow copy per returned doc;
+    # rrf_rank tracks position in fused list)
     results = []
     for doc_id, score in sorted_docs:
-        doc = docs[doc_id].copy()
-        doc[score_key] = score
-        doc["rrf_rank"] = len(results)  # Track position in fused list
-        results.append(doc)
+        results.append({**docs[doc_id], score_key: score, "rrf_rank": len(results)})
     
     return results
 
@@ -86,7 +110,8 @@ def reciprocal_rank_fusion(
 def position_aware_blend(
     rrf_results: List[Dict],
     rerank_scores: Dict[str, float],
-    id_key: str = "file_path"
+    id_key: str = "file_path",
+    top_k: Optional[int] = None
 ) -> List[Dict]:
     """
     Blend RRF scores with reranker scores using position-aware weighting.
@@ -99,6 +124,7 @@ def position_aware_blend(
     Args:
         rrf_results: Results from RRF fusion with 'score' key
         rerank_scores: Dict mapping doc_id to reranker score (0-1)
+        top_k: Only return the best top_k documents
     
     Returns:
         Results re-sorted by blended score
@@ -130,7 +156,9 @@ def position_aware_blend(
         results.append(result)
     
     # Re-sort by blended score
-    return sorted(results, key=lambda x: x["score"], reverse=True)
+    if top_k is None:
+        return sorted(results, key=itemgetter("score"), reverse=True)
+    return heapq.nlargest(top_k, results, key=itemgetter("score"))
 
 
 def normalize_scores(results: List[Dict], score_key: str = "score") -> List[Dict]:
@@ -140,9 +168,14 @@ def normalize_scores(results: List[Dict], score_key: str = "score") -> List[Dict
     if not results:
         return results
     
-    scores = [r.get(score_key, 0) for r in results]
-    min_score = min(scores)
-    max_score = max(scores)
+    # Running min/max in one pass, without an intermediate score list
+    min_score = max_score = results[0].get(score_key, 0)
+    for r in results:
+        score = r.get(score_key, 0)
+        if score < min_score:
+            min_score = score
+        elif score > max_score:
+            max_score = score
     
     if max_score == min_score:
         # All same score, normalize to 1.0
@@ -150,8 +183,8 @@ def normalize_scores(results: List[Dict], score_key: str = "score") -> List[Dict
             r[score_key] = 1.0
         return results
     
+    score_range = max_score - min_score
     for r in results:
-        old_score = r.get(score_key, 0)
-        r[score_key] = (old_score - min_score) / (max_score - min_score)
+        r[score_key] = (r.get(score_key, 0) - min_score) / score_range
     
     return results
@@ -15,12 +15,12 @@ import logging
 import hashlib
 import asyncio
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
 
 import httpx
-import frontmatter
+import pyarrow as pa
 import lancedb
 from lancedb.pydantic import LanceModel, Vector
 
@@ -32,20 +32,61 @@ except ImportError:
     PDF_ENABLED = False
     fitz = None
 
-from config import Settings
+# Faster SIMD hashing for change detection (optional, falls back to BLAKE2b)
+try:
+    import blake3
+    BLAKE3_ENABLED = True
+except ImportError:
+    BLAKE3_ENABLED = False
+    blake3 = None
+
+from config import Settings, settings as app_settings
+from embedding_cache import content_hash
+from fast_frontmatter import parse_frontmatter
+from text_utils import truncate_utf8
 
 logger = logging.getLogger(__name__)
 
-# Thread pool for CPU-bound operations (file I/O, hashing, chunking)
-_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="indexer")
+# Thread pool for CPU-bound operations (file I/O, hashing, chunking).
+# Defaults to one worker per core, leaving a core for the event loop.
+INDEXER_WORKERS = app_settings.indexer_workers or max(1, (os.cpu_count() or 2) - 1)
+_executor = ThreadPoolExecutor(max_workers=INDEXER_WORKERS, thread_name_prefix="indexer")
+
+# Max UTF-8 bytes of a chunk sent for embedding
+EMBED_MAX_BYTES = 8000
+
+# Chunk boundaries: blank lines, or before an H2/H3 header
+SECTION_SPLIT_RE = re.compile(r'\n\n+|(?=^###?\s)', re.MULTILINE)
+
+# Documents shorter than this are chunked inline; the executor hop costs more
+CHUNK_INLINE_MAX = 16_384
+
+# Files per asyncio.gather window in full_reindex
+REINDEX_WINDOW = 64
+
+# Rows buffered across files before one table.add (fewer, larger fragments)
+ADD_BUFFER_ROWS = 2000
+
+# Changed files per batched delete in incremental_index
+DELETE_WINDOW = 64
+
+# Connection pool for Ollama calls (keep-alive reuse across embeddings)
+OLLAMA_LIMITS = httpx.Limits(max_keepalive_connections=40, max_connections=100, keepalive_expiry=30)
+
+
+def file_digest(data: bytes) -> str:
+    """128-bit hex digest of file content, used for change detection."""
+    if BLAKE3_ENABLED:
+        return blake3.blake3(data).hexdigest(length=16)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
 
 
 class DocumentChunk(LanceModel):
     """Schema for document chunks in LanceDB."""
-    id: str                      # Unique chunk ID (file_hash + chunk_index)
+    id: str                      # Chunk ID (file path hash + chunk content hash)
     vector: Vector(768)          # nomic-embed-text dimension
     file_path: str
-    file_hash: str               # MD5 of file content (for change detection)
+    file_hash: str               # BLAKE3/BLAKE2b of file content (for change detection)
     mtime: float                 # File modification time (Unix timestamp) for fast change detection
     title: str
     category: str
@@ -59,15 +100,30 @@ class DocumentChunk(LanceModel):
     page_number: Optional[int] = None  # For PDFs: page number (1-indexed)
 
 
+# Arrow schema derived once from the model; used for table creation and for
+# direct columnar writes, so no pydantic objects are built per chunk
+CHUNK_SCHEMA = DocumentChunk.to_arrow_schema()
+
+
 class Indexer:
-    def __init__(self, db: lancedb.DBConnection, settings: Settings, fts_index=None):
+    def __init__(self, db: lancedb.DBConnection, settings: Settings, fts_index=None, persistent_cache=None):
         self.db = db
         self.settings = settings
         self.embedding_cache = {}
+        self.persistent_cache = persistent_cache  # Optional EmbeddingCache (survives restarts)
         self._cancel_requested = False
         self.fts_index = fts_index  # Optional FTS index for hybrid search
         self._gpu_ollama_url = None  # Override URL when using GPU
         self._embedding_batch_size = 10  # Batch size for embeddings
+        # Shared client; no base_url since the GPU override can change the host
+        self._client = httpx.AsyncClient(limits=OLLAMA_LIMITS)
+        # Excluded folder substrings, compiled into one alternation
+        excluded = settings.excluded_folders_list
+        self._excluded_re = re.compile("|".join(map(re.escape, excluded))) if excluded else None
+    
+    async def aclose(self):
+        """Close the shared HTTP client (call on shutdown)."""
+        await self._client.aclose()
     
     def request_cancel(self):
         """Request cancellation of current indexing job."""
@@ -94,81 +150,128 @@ class Indexer:
         
         if "work" not in existing_tables:
             logger.info("Creating 'work' table")
-            self.db.create_table("work", schema=DocumentChunk)
+            self.db.create_table("work", schema=CHUNK_SCHEMA)
         
         if "personal" not in existing_tables:
             logger.info("Creating 'personal' table")
-            self.db.create_table("personal", schema=DocumentChunk)
+            self.db.create_table("personal", schema=CHUNK_SCHEMA)
         
         logger.info("Tables initialized")
     
     async def get_embedding(self, text: str) -> List[float]:
         """Get embedding from Ollama (single text)."""
         # Check cache
-        cache_key = hashlib.md5(text.encode()).hexdigest()
+        cache_key = content_hash(text)
         if cache_key in self.embedding_cache:
             return self.embedding_cache[cache_key]
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.ollama_url}/api/embed",
-                json={
-                    "model": self.settings.embedding_model,
-                    "input": text
-                },
-                timeout=60.0
-            )
-            response.raise_for_status()
-            data = response.json()
-            embedding = data["embeddings"][0]
+        model = self.settings.embedding_model
+        if self.persistent_cache:
+            stored = self.persistent_cache.get_many([cache_key], model)
+            if cache_key in stored:
+                self.embedding_cache[cache_key] = stored[cache_key]
+                return stored[cache_key]
+        
+        response = await self._client.post(
+            f"{self.ollama_url}/api/embed",
+            json={
+                "model": model,
+                "input": text
+            },
+            timeout=60.0
+        )
+        response.raise_for_status()
+        data = response.json()
+        embedding = data["embeddings"][0]
         
         # Cache it
         self.embedding_cache[cache_key] = embedding
+        if self.persistent_cache:
+            self.persistent_cache.put_many([(cache_key, embedding)], model)
         return embedding
     
-    async def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
-        """Get embeddings for multiple texts in one API call (faster)."""
+    async def get_embeddings_batch(self, texts: List[str], keys: Optional[List[str]] = None) -> List[List[float]]:
+        """
+        Get embeddings for multiple texts in one API call (faster).
+        
+        Posts all uncached texts as an "input" array to /api/embed. If the
+        batch call fails or the response has no usable "embeddings" array,
+        falls back to concurrent single-text requests.
+        
+        keys: precomputed content_hash() of each text, if the caller has them
+        """
         if not texts:
             return []
+        if keys is None:
+            keys = [content_hash(text) for text in texts]
         
         # Check cache for all texts, collect uncached
         results = [None] * len(texts)
         uncached_indices = []
         uncached_texts = []
+        uncached_keys = []
         
-        for i, text in enumerate(texts):
-            cache_key = hashlib.md5(text.encode()).hexdigest()
+        for i, (text, cache_key) in enumerate(zip(texts, keys)):
             if cache_key in self.embedding_cache:
                 results[i] = self.embedding_cache[cache_key]
             else:
                 uncached_indices.append(i)
                 uncached_texts.append(text)
+                uncached_keys.append(cache_key)
+        
+        # One batched lookup in the persistent cache for the in-memory misses
+        model = self.settings.embedding_model
+        if uncached_keys and self.persistent_cache:
+            stored = self.persistent_cache.get_many(uncached_keys, model)
+            if stored:
+                remaining = []
+                for i, text, cache_key in zip(uncached_indices, uncached_texts, uncached_keys):
+                    embedding = stored.get(cache_key)
+                    if embedding is None:
+                        remaining.append((i, text, cache_key))
+                    else:
+                        results[i] = embedding
+                        self.embedding_cache[cache_key] = embedding
+                uncached_indices = [r[0] for r in remaining]
+                uncached_texts = [r[1] for r in remaining]
+                uncached_keys = [r[2] for r in remaining]
         
         # If all cached, return early
         if not uncached_texts:
             return results
         
         # Batch API call for uncached texts
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
+        try:
+            response = await self._client.post(
                 f"{self.ollama_url}/api/embed",
                 json={
-                    "model": self.settings.embedding_model,
-                    "input": uncached_texts  # Ollama supports list input
+                    "model": model,
+                    "input": [truncate_utf8(t, EMBED_MAX_BYTES) for t in uncached_texts]  # Ollama supports list input
                 },
                 timeout=120.0  # Longer timeout for batches
             )
             response.raise_for_status()
             data = response.json()
-            embeddings = data["embeddings"]
+            embeddings = data.get("embeddings")
+        except Exception as e:
+            logger.warning(f"Batch embedding failed, falling back to single requests: {e}")
+            embeddings = None
+        
+        # Older Ollama builds (or a failed batch) - embed one text per request
+        if not embeddings or len(embeddings) != len(uncached_texts):
+            embeddings = await asyncio.gather(
+                *(self.get_embedding(truncate_utf8(t, EMBED_MAX_BYTES)) for t in uncached_texts)
+            )
         
         # Fill in results and cache
         for i, idx in enumerate(uncached_indices):
             embedding = embeddings[i]
             results[idx] = embedding
             # Cache it
-            cache_key = hashlib.md5(uncached_texts[i].encode()).hexdigest()
-            self.embedding_cache[cache_key] = embedding
+            self.embedding_cache[uncached_keys[i]] = embedding
+        
+        if self.persistent_cache:
+            self.persistent_cache.put_many(zip(uncached_keys, embeddings), model)
         
         return results
     
@@ -176,11 +279,23 @@ class Indexer:
         """Split document into chunks with overlap. (CPU-bound, runs in thread pool)"""
         chunks = []
         
+        max_chars = self.settings.chunk_size * 4  # Approx chars
+        overlap_chars = self.settings.chunk_overlap * 4
+        
+        # Short notes (most of a vault) and text with no section breaks are a
+        # single chunk; skip the regex split entirely
+        if len(content) <= max_chars or ("\n\n" not in content and "#" not in content):
+            body = content.strip()
+            return [{"chunk_index": 0, "content": body, **metadata}] if body else []
+        
         # Simple chunking by paragraphs/sections
         # Split on double newlines or headers
-        sections = re.split(r'\n\n+|(?=^###?\s)', content, flags=re.MULTILINE)
+        sections = SECTION_SPLIT_RE.split(content)
         
-        current_chunk = ""
+        # Current chunk is kept as a list of parts (joined with blank lines only
+        # when emitted) plus its joined length
+        parts = []
+        current_len = 0
         chunk_index = 0
         
         for section in sections:
@@ -189,8 +304,9 @@ class Indexer:
                 continue
             
             # If adding this section exceeds chunk size, save current and start new
-            if len(current_chunk) + len(section) > self.settings.chunk_size * 4:  # Approx chars
-                if current_chunk:
+            if current_len + len(section) > max_chars:
+                if parts:
+                    current_chunk = "\n\n".join(parts)
                     chunks.append({
                         "chunk_index": chunk_index,
                         "content": current_chunk.strip(),
@@ -198,14 +314,18 @@ class Indexer:
                     })
                     chunk_index += 1
                     # Keep overlap
-                    overlap_start = max(0, len(current_chunk) - self.settings.chunk_overlap * 4)
-                    current_chunk = current_chunk[overlap_start:] + "\n\n" + section
+                    overlap_start = max(0, current_len - overlap_chars)
+                    parts = [current_chunk[overlap_start:], section]
+                    current_len = current_len - overlap_start + 2 + len(section)
                 else:
-                    current_chunk = section
+                    parts = [section]
+                    current_len = len(section)
             else:
-                current_chunk += "\n\n" + section if current_chunk else section
+                current_len += len(section) + 2 if parts else len(section)
+                parts.append(section)
         
         # Add final chunk
+        current_chunk = "\n\n".join(parts)
         if current_chunk.strip():
             chunks.append({
                 "chunk_index": chunk_index,
@@ -217,6 +337,8 @@ class Indexer:
     
     async def chunk_document(self, content: str, metadata: dict) -> List[Dict]:
         """Split document into chunks with overlap. Non-blocking wrapper."""
+        if len(content) < CHUNK_INLINE_MAX:
+            return self._chunk_document_sync(content, metadata)
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(
             _executor, 
@@ -225,13 +347,15 @@ class Indexer:
             metadata
         )
     
-    def _extract_metadata_sync(self, file_path: Path, content: str) -> Dict:
-        """Extract metadata from file. (CPU-bound, runs in thread pool)"""
-        # Parse frontmatter
+    def _extract_metadata_sync(self, file_path: Path, content: str, content_bytes: bytes) -> Dict:
+        """
+        Extract metadata from file. (CPU-bound, runs in thread pool)
+        
+        content_bytes is the UTF-8 encoding of content (as returned by read_file).
+        """
+        # Parse frontmatter (flat headers without PyYAML; frontmatter.loads otherwise)
         try:
-            post = frontmatter.loads(content)
-            fm = post.metadata
-            body = post.content
+            fm, body = parse_frontmatter(content)
         except:
             fm = {}
             body = content
@@ -276,7 +400,7 @@ class Indexer:
         
         return {
             "file_path": str(file_path),
-            "file_hash": hashlib.md5(content.encode()).hexdigest(),
+            "file_hash": file_digest(content_bytes),
             "title": title,
             "category": category,
             "people": people,
@@ -286,36 +410,44 @@ class Indexer:
             "body": body
         }
     
-    async def extract_metadata(self, file_path: Path, content: str) -> Dict:
+    async def extract_metadata(self, file_path: Path, content: str, content_bytes: bytes) -> Dict:
         """Extract metadata from file. Non-blocking wrapper."""
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(
             _executor,
             self._extract_metadata_sync,
             file_path,
-            content
+            content,
+            content_bytes
         )
     
-    def is_excluded(self, file_path: Path) -> bool:
+    def is_excluded(self, file_path: Union[Path, str]) -> bool:
         """Check if file should be excluded."""
-        path_str = str(file_path)
-        for excluded in self.settings.excluded_folders_list:
-            if excluded in path_str:
-                return True
-        return False
+        return self._excluded_re is not None and self._excluded_re.search(str(file_path)) is not None
     
-    def _read_file_sync(self, file_path: Path) -> Optional[str]:
-        """Read file content. (I/O-bound, runs in thread pool)"""
+    def _read_file_sync(self, file_path: Path) -> Optional[Tuple[str, bytes]]:
+        """Read file content as (text, UTF-8 bytes of text)."""
         try:
-            return file_path.read_text(encoding='utf-8')
+            data = file_path.read_bytes()
+            text = data.decode('utf-8')
+            # Universal newlines, as read_text() would give; the bytes must match the text
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+                data = text.encode()
+            return text, data
         except Exception as e:
             logger.error(f"Error reading {file_path}: {e}")
             return None
     
-    async def read_file(self, file_path: Path) -> Optional[str]:
-        """Read file content. Non-blocking wrapper."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(_executor, self._read_file_sync, file_path)
+    async def read_file(self, file_path: Path) -> Optional[Tuple[str, bytes]]:
+        """
+        Read file content as (text, bytes); the bytes are reused for hashing
+        so the text never has to be encoded again.
+        
+        Notes are small, so this reads inline: the read is cheaper than a
+        thread-pool round trip.
+        """
+        return self._read_file_sync(file_path)
     
     # ==================== PDF SUPPORT ====================
     
@@ -346,16 +478,38 @@ class Indexer:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(_executor, self._extract_pdf_pages_sync, file_path)
     
-    def _list_pdf_files_sync(self, pdf_path: Path) -> List[Path]:
-        """List all PDF files in path. (I/O-bound, runs in thread pool)"""
-        if not pdf_path.exists():
-            return []
+    def _walk_files(self, root: Path, suffix: str) -> List[Path]:
+        """
+        Iterative os.scandir walk returning non-hidden files ending in suffix.
+        
+        Uses the DirEntry type info instead of a stat per path, and does not
+        descend into excluded directories (or symlinked ones, like rglob).
+        """
         files = []
-        for pdf_file in pdf_path.rglob("*.pdf"):
-            if not pdf_file.name.startswith("."):
-                files.append(pdf_file)
+        stack = [str(root)]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError as e:
+                logger.debug(f"Cannot list {e.filename}: {e}")
+                continue
+            with it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not self.is_excluded(entry.path):
+                                stack.append(entry.path)
+                        elif (entry.name.endswith(suffix) and not entry.name.startswith(".")
+                              and entry.is_file() and not self.is_excluded(entry.path)):
+                            files.append(Path(entry.path))
+                    except OSError:
+                        continue
         return files
     
+    def _list_pdf_files_sync(self, pdf_path: Path) -> List[Path]:
+        """List all PDF files in path. (I/O-bound, runs in thread pool)"""
+        return self._walk_files(pdf_path, ".pdf")
+    
     async def list_pdf_files(self, pdf_path: Path) -> List[Path]:
         """List all PDF files in path. Non-blocking wrapper."""
         loop = asyncio.get_event_loop()
@@ -394,9 +548,9 @@ class Indexer:
         # Calculate file hash for change detection
         try:
             with open(file_path, 'rb') as f:
-                file_hash = hashlib.md5(f.read()).hexdigest()
+                file_hash = file_digest(f.read())
         except:
-            file_hash = hashlib.md5(str(file_path).encode()).hexdigest()
+            file_hash = file_digest(str(file_path).encode())
         
         return {
             "file_path": str(file_path),
@@ -462,8 +616,19 @@ class Indexer:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(_executor, self._chunk_pdf_pages_sync, pages, metadata)
     
-    async def index_pdf_file(self, file_path: Path, table_name: str, mtime: Optional[float] = None) -> int:
-        """Index a single PDF file."""
+    async def index_pdf_file(
+        self,
+        file_path: Path,
+        table_name: str,
+        mtime: Optional[float] = None,
+        pending: Optional[List[pa.Table]] = None
+    ) -> int:
+        """
+        Index a single PDF file. Does not delete the file's previous rows.
+        
+        If pending is given, rows are appended to it for a later
+        _flush_pending instead of being added to the table right away.
+        """
         if not PDF_ENABLED:
             logger.warning("PDF support not available (PyMuPDF not installed)")
             return 0
@@ -500,49 +665,28 @@ class Indexer:
             logger.info("PDF indexing cancelled")
             return 0
         
-        # Batch embed all PDF chunks at once
+        # Batch embed all PDF chunks at once (unchanged chunks come from the cache)
         try:
-            chunk_texts = [chunk["content"][:8000] for chunk in chunks]
-            embeddings = await self.get_embeddings_batch(chunk_texts)
+            chunk_texts = [truncate_utf8(chunk["content"], EMBED_MAX_BYTES) for chunk in chunks]
+            chunk_keys = [content_hash(text) for text in chunk_texts]
+            embeddings = await self.get_embeddings_batch(chunk_texts, chunk_keys)
         except Exception as e:
             logger.error(f"Batch embedding failed for PDF {file_path}: {e}")
             return 0
         
-        # Prepare records with embeddings
-        records = []
-        for i, chunk in enumerate(chunks):
-            try:
-                chunk_id = f"{chunk['file_hash']}_{chunk['chunk_index']}"
-                
-                records.append(DocumentChunk(
-                    id=chunk_id,
-                    vector=embeddings[i],
-                    file_path=chunk["file_path"],
-                    file_hash=chunk["file_hash"],
-                    mtime=mtime,
-                    title=chunk["title"],
-                    category=chunk["category"],
-                    people=chunk.get("people", []),
-                    projects=chunk.get("projects", []),
-                    date=chunk.get("date"),
-                    vault=chunk["vault"],
-                    chunk_index=chunk["chunk_index"],
-                    content=chunk["content"],
-                    source_type="pdf",
-                    page_number=chunk.get("page_number")
-                ))
-            except Exception as e:
-                logger.error(f"Error preparing PDF chunk {chunk['chunk_index']} of {file_path}: {e}")
+        # Build one columnar batch for the whole file
+        try:
+            records = self._build_chunk_table(chunks, embeddings, file_path, chunk_keys, mtime, "pdf")
+        except Exception as e:
+            logger.error(f"Error preparing PDF chunks of {file_path}: {e}")
+            return 0
         
-        if records:
-            # Delete existing chunks for this file
-            try:
-                table.delete(f'file_hash = "{metadata["file_hash"]}"')
-            except:
-                pass
-            
-            # Add new records
-            table.add([r.dict() for r in records])
+        if records.num_rows:
+            # Add new records (callers remove this file's old rows beforehand)
+            if pending is None:
+                table.add(records)
+            else:
+                pending.append(records)
             logger.info(f"Indexed {len(records)} chunks from PDF: {file_path.name}")
             
             # Also index to FTS for hybrid search
@@ -565,16 +709,68 @@ class Indexer:
     
     # ==================== END PDF SUPPORT ====================
     
-    async def index_file(self, file_path: Path, table_name: str, mtime: Optional[float] = None) -> int:
-        """Index a single file."""
+    def _build_chunk_table(
+        self,
+        chunks: List[Dict],
+        embeddings: List[List[float]],
+        file_path: Path,
+        chunk_keys: List[str],
+        mtime: float,
+        source_type: str
+    ) -> pa.Table:
+        """
+        Build the rows for one file as a columnar Arrow table matching DocumentChunk.
+        
+        Vectors are converted straight into a contiguous fixed-size float32
+        list column; a wrong dimension raises instead of writing a bad row.
+        """
+        # Content-addressed IDs; the chunk index keeps identical chunks in one file distinct
+        path_key = content_hash(str(file_path))[:16]
+        n = len(chunks)
+        columns = {
+            "id": [f"{path_key}_{i}_{key}" for i, key in enumerate(chunk_keys)],
+            "vector": embeddings,
+            "file_path": [chunk["file_path"] for chunk in chunks],
+            "file_hash": [chunk["file_hash"] for chunk in chunks],
+            "mtime": [mtime] * n,
+            "title": [chunk["title"] for chunk in chunks],
+            "category": [chunk["category"] for chunk in chunks],
+            "people": [chunk.get("people", []) for chunk in chunks],
+            "projects": [chunk.get("projects", []) for chunk in chunks],
+            "date": [chunk.get("date") for chunk in chunks],
+            "vault": [chunk["vault"] for chunk in chunks],
+            "chunk_index": [chunk["chunk_index"] for chunk in chunks],
+            "content": [chunk["content"] for chunk in chunks],
+            "source_type": [source_type] * n,
+            "page_number": [chunk.get("page_number") for chunk in chunks],
+        }
+        return pa.Table.from_arrays(
+            [pa.array(columns[field.name], type=field.type) for field in CHUNK_SCHEMA],
+            schema=CHUNK_SCHEMA
+        )
+    
+    async def index_file(
+        self,
+        file_path: Path,
+        table_name: str,
+        mtime: Optional[float] = None,
+        pending: Optional[List[pa.Table]] = None
+    ) -> int:
+        """
+        Index a single file. Does not delete the file's previous rows.
+        
+        If pending is given, rows are appended to it for a later
+        _flush_pending instead of being added to the table right away.
+        """
         if self.is_excluded(file_path):
             logger.debug(f"Skipping excluded file: {file_path}")
             return 0
         
-        content = await self.read_file(file_path)
-        if content is None or len(content.strip()) < 50:
+        read = await self.read_file(file_path)
+        if read is None or len(read[0].strip()) < 50:
             logger.debug(f"Skipping short/unreadable file: {file_path}")
             return 0
+        content, content_bytes = read
         
         # Get mtime if not provided
         if mtime is None:
@@ -583,7 +779,7 @@ class Indexer:
             except:
                 mtime = 0.0
         
-        metadata = await self.extract_metadata(file_path, content)
+        metadata = await self.extract_metadata(file_path, content, content_bytes)
         body = metadata.pop("body")
         chunks = await self.chunk_document(body, metadata)
         
@@ -597,49 +793,30 @@ class Indexer:
             logger.info("Indexing cancelled")
             return 0
         
-        # Batch embed all chunks at once (much faster!)
+        # Batch embed all chunks at once (much faster!). Chunks whose content
+        # hash is already cached reuse their vector, so an edit to a long note
+        # only re-embeds the chunks that actually changed.
         try:
-            chunk_texts = [chunk["content"][:8000] for chunk in chunks]
-            embeddings = await self.get_embeddings_batch(chunk_texts)
+            chunk_texts = [truncate_utf8(chunk["content"], EMBED_MAX_BYTES) for chunk in chunks]
+            chunk_keys = [content_hash(text) for text in chunk_texts]
+            embeddings = await self.get_embeddings_batch(chunk_texts, chunk_keys)
         except Exception as e:
             logger.error(f"Batch embedding failed for {file_path}: {e}")
             return 0
         
-        # Prepare records with embeddings
-        records = []
-        for i, chunk in enumerate(chunks):
-            try:
-                chunk_id = f"{chunk['file_hash']}_{chunk['chunk_index']}"
-                
-                records.append(DocumentChunk(
-                    id=chunk_id,
-                    vector=embeddings[i],
-                    file_path=chunk["file_path"],
-                    file_hash=chunk["file_hash"],
-                    mtime=mtime,
-                    title=chunk["title"],
-                    category=chunk["category"],
-                    people=chunk["people"],
-                    projects=chunk["projects"],
-                    date=chunk["date"],
-                    vault=chunk["vault"],
-                    chunk_index=chunk["chunk_index"],
-                    content=chunk["content"],
-                    source_type="markdown",
-                    page_number=None
-                ))
-            except Exception as e:
-                logger.error(f"Error preparing chunk {chunk['chunk_index']} of {file_path}: {e}")
+        # Build one columnar batch for the whole file
+        try:
+            records = self._build_chunk_table(chunks, embeddings, file_path, chunk_keys, mtime, "markdown")
+        except Exception as e:
+            logger.error(f"Error preparing chunks of {file_path}: {e}")
+            return 0
         
-        if records:
-            # Delete existing chunks for this file (by file_hash prefix)
-            try:
-                table.delete(f'file_hash = "{metadata["file_hash"]}"')
-            except:
-                pass  # Table might be empty
-            
-            # Add new records
-            table.add([r.dict() for r in records])
+        if records.num_rows:
+            # Add new records (callers remove this file's old rows beforehand)
+            if pending is None:
+                table.add(records)
+            else:
+                pending.append(records)
             logger.info(f"Indexed {len(records)} chunks from {file_path.name}")
             
             # Also index to FTS for hybrid search
@@ -661,11 +838,7 @@ class Indexer:
     
     def _list_markdown_files_sync(self, vault_path: Path) -> List[Path]:
         """List all markdown files in vault. (I/O-bound, runs in thread pool)"""
-        files = []
-        for md_file in vault_path.rglob("*.md"):
-            if not md_file.name.startswith("."):
-                files.append(md_file)
-        return files
+        return self._walk_files(vault_path, ".md")
     
     async def list_markdown_files(self, vault_path: Path) -> List[Path]:
         """List all markdown files in vault. Non-blocking wrapper."""
@@ -676,12 +849,13 @@ class Indexer:
             vault_path
         )
     
-    async def full_reindex(self, vault: str = "all", progress_callback=None) -> int:
+    async def full_reindex(self, vault: str = "all", progress_callback=None, concurrency: int = 4) -> int:
         """Full reindex of vault(s). Non-blocking. Includes both Markdown and PDFs.
         
         Args:
             vault: Which vault(s) to index ("all", "work", "personal")
             progress_callback: Optional async callable(processed: int, total: int, current_file: str)
+            concurrency: Max Markdown files indexed at once (overlaps file I/O and embedding calls)
         """
         self._cancel_requested = False
         total_indexed = 0
@@ -722,7 +896,7 @@ class Indexer:
                     logger.info(f"Dropping existing table '{table_name}' for schema refresh")
                     self.db.drop_table(table_name)
                 logger.info(f"Creating table '{table_name}' with current schema")
-                self.db.create_table(table_name, schema=DocumentChunk)
+                self.db.create_table(table_name, schema=CHUNK_SCHEMA)
             except Exception as e:
                 logger.error(f"Error recreating table {table_name}: {e}")
                 # Fallback: try to clear existing table
@@ -745,23 +919,33 @@ class Indexer:
             total_md = len(md_files)
             logger.info(f"Found {total_md} Markdown files to index in {table_name}")
             
-            for i, md_file in enumerate(md_files):
+            sem = asyncio.Semaphore(concurrency)
+            pending: List[pa.Table] = []  # Rows buffered across files
+            
+            async def index_one(md_file: Path) -> int:
+                async with sem:
+                    if self._cancel_requested:
+                        return 0
+                    return await self.index_file(md_file, table_name, pending=pending)
+            
+            # Index in windows so progress reporting and cancellation still work
+            for start in range(0, total_md, REINDEX_WINDOW):
                 if self._cancel_requested:
                     logger.info("Indexing cancelled by request")
                     break
                 
-                count = await self.index_file(md_file, table_name)
-                total_indexed += count
-                processed_files += 1
+                window = md_files[start:start + REINDEX_WINDOW]
+                counts = await asyncio.gather(*map(index_one, window))
+                total_indexed += sum(counts)
+                processed_files += len(window)
+                self._flush_pending(table_name, pending, ADD_BUFFER_ROWS)
                 
                 # Report progress
-                if progress_callback and processed_files % 5 == 0:
-                    await progress_callback(processed_files, total_files, str(md_file))
+                if progress_callback:
+                    await progress_callback(processed_files, total_files, str(window[-1]))
                 
-                if i % 10 == 0:
-                    await asyncio.sleep(0)
-                    if i > 0 and i % 100 == 0:
-                        logger.info(f"Markdown progress: {i}/{total_md} files ({table_name})")
+                await asyncio.sleep(0)
+                logger.info(f"Markdown progress: {start + len(window)}/{total_md} files ({table_name})")
             
             # === INDEX PDF FILES ===
             if self.settings.pdf_enabled and PDF_ENABLED:
@@ -775,9 +959,10 @@ class Indexer:
                             logger.info("PDF indexing cancelled by request")
                             break
                         
-                        count = await self.index_pdf_file(pdf_file, table_name)
+                        count = await self.index_pdf_file(pdf_file, table_name, pending=pending)
                         total_indexed += count
                         processed_files += 1
+                        self._flush_pending(table_name, pending, ADD_BUFFER_ROWS)
                         
                         # Report progress
                         if progress_callback:
@@ -787,6 +972,13 @@ class Indexer:
                             await asyncio.sleep(0)
                             if i > 0:
                                 logger.info(f"PDF progress: {i}/{total_pdfs} files ({table_name})")
+            
+            # Write whatever is still buffered, then merge the fragments
+            self._flush_pending(table_name, pending)
+            try:
+                self.db.open_table(table_name).compact_files()
+            except Exception as e:
+                logger.warning(f"Compaction of {table_name} failed: {e}")
         
         # Report completion
         if progress_callback:
@@ -795,6 +987,72 @@ class Indexer:
         logger.info(f"Full reindex complete: {total_indexed} chunks (Markdown + PDF)")
         return total_indexed
     
+    def _read_indexed_files(self, table) -> Dict[str, Dict]:
+        """
+        Map file_path -> {"file_hash", "mtime"} for every indexed file.
+        
+        Reads just those columns with a projection scan of the Lance dataset
+        (no vector query machinery, no row limit).
+        """
+        dataset = table.to_lance()
+        has_mtime = "mtime" in dataset.schema.names  # Legacy tables predate mtime
+        columns = ["file_path", "file_hash", "mtime"] if has_mtime else ["file_path", "file_hash"]
+        data = dataset.to_table(columns=columns)
+        
+        paths = data.column("file_path").to_pylist()
+        hashes = data.column("file_hash").to_pylist()
+        mtimes = data.column("mtime").to_pylist() if has_mtime else [0.0] * len(paths)
+        
+        # Dedupe by file_path (multiple chunks per file); first row wins
+        indexed_files = {}
+        for fp, file_hash, mtime in zip(paths, hashes, mtimes):
+            if fp not in indexed_files:
+                indexed_files[fp] = {"file_hash": file_hash, "mtime": mtime}
+        return indexed_files
+    
+    def _flush_pending(self, table_name: str, pending: List[pa.Table], min_rows: int = 0):
+        """Add buffered rows to the table as one write once at least min_rows are waiting."""
+        rows = sum(t.num_rows for t in pending)
+        if not rows or rows < min_rows:
+            return
+        self.db.open_table(table_name).add(pa.concat_tables(pending))
+        pending.clear()
+    
+    def _delete_file_rows(self, table, file_paths: List[str]):
+        """Delete all rows for the given files, one IN (...) predicate per DELETE_WINDOW paths."""
+        for start in range(0, len(file_paths), DELETE_WINDOW):
+            in_list = ", ".join(f'"{fp}"' for fp in file_paths[start:start + DELETE_WINDOW])
+            table.delete(f"file_path IN ({in_list})")
+    
+    async def _reindex_changed(self, table, table_name: str, changed: List[Tuple[Path, float, bool]], index_fn) -> int:
+        """
+        Re-index a window of new/modified files.
+        
+        changed: (file, mtime, was_indexed) tuples. The window's files are
+        re-embedded first; old rows are then removed with a single delete, only
+        for previously indexed files whose new rows were built, right before
+        the window's new rows are added in a single write. A file that fails
+        (or is cancelled) keeps its old rows and is retried on the next run.
+        """
+        count = 0
+        stale = []
+        pending: List[pa.Table] = []
+        for file_path, mtime, was_indexed in changed:
+            if self._cancel_requested:
+                break
+            added = await index_fn(file_path, table_name, mtime=mtime, pending=pending)
+            if added and was_indexed:
+                stale.append(str(file_path))
+            count += added
+        if stale:
+            try:
+                self._delete_file_rows(table, stale)
+            except Exception as e:
+                logger.warning(f"Failed to delete stale rows for {len(stale)} files: {e}")
+        self._flush_pending(table_name, pending)
+        await asyncio.sleep(0)
+        return count
+    
     async def incremental_index(self, vault: str = "all", progress_callback=None) -> int:
         """
         Incremental index (only new/modified/deleted files). Non-blocking.
@@ -826,19 +1084,11 @@ class Indexer:
             
             # Get existing indexed files with mtime and hash
             try:
-                existing = table.search().select(["file_path", "file_hash", "mtime"]).limit(100000).to_list()
-                # Dedupe by file_path (multiple chunks per file)
-                indexed_files = {}
-                for r in existing:
-                    fp = r["file_path"]
-                    if fp not in indexed_files:
-                        indexed_files[fp] = {
-                            "file_hash": r["file_hash"],
-                            "mtime": r.get("mtime", 0.0)  # Handle legacy records without mtime
-                        }
+                indexed_files = self._read_indexed_files(table)
             except Exception as e:
-                logger.warning(f"Could not read existing index: {e}")
-                indexed_files = {}
+                # Treating the table as empty would re-add every file next to its old rows
+                logger.error(f"Could not read existing index of {table_name} vault, skipping it: {e}")
+                continue
             
             # List files on disk (non-blocking) - both Markdown and PDF
             md_files = await self.list_markdown_files(vault_path)
@@ -853,25 +1103,24 @@ class Indexer:
             deleted_files = set(indexed_files.keys()) - disk_files
             if deleted_files:
                 logger.info(f"Found {len(deleted_files)} deleted files to remove from index")
-                for deleted_path in deleted_files:
-                    if self._cancel_requested:
-                        break
-                    try:
-                        table.delete(f'file_path = "{deleted_path}"')
-                        total_deleted += 1
-                        # Also remove from FTS
-                        if self.fts_index:
+                try:
+                    self._delete_file_rows(table, sorted(deleted_files))
+                    total_deleted += len(deleted_files)
+                    # Also remove from FTS
+                    if self.fts_index:
+                        for deleted_path in deleted_files:
                             try:
                                 self.fts_index.delete_document(deleted_path, table_name)
                             except:
                                 pass
-                    except Exception as e:
-                        logger.warning(f"Failed to delete {deleted_path} from index: {e}")
+                except Exception as e:
+                    logger.warning(f"Failed to delete {len(deleted_files)} files from index: {e}")
             
             # === MARKDOWN CHANGE DETECTION ===
             files_checked = 0
             files_skipped_mtime = 0
             files_skipped_hash = 0
+            changed = []  # (file, mtime, was_indexed) awaiting a batched delete + re-index
             
             for md_file in md_files:
                 if self._cancel_requested:
@@ -896,17 +1145,12 @@ class Indexer:
                         continue
                     
                     # mtime changed - need to check content hash
-                    content = await self.read_file(md_file)
-                    if content is None:
+                    read = await self.read_file(md_file)
+                    if read is None:
                         continue
                     
-                    # TIER 2: content hash check
-                    loop = asyncio.get_event_loop()
-                    current_hash = await loop.run_in_executor(
-                        _executor,
-                        lambda c: hashlib.md5(c.encode()).hexdigest(),
-                        content
-                    )
+                    # TIER 2: content hash check (inline - cheaper than an executor hop)
+                    current_hash = file_digest(read[1])
                     
                     if current_hash == indexed_files[file_path_str]["file_hash"]:
                         # Content unchanged (mtime was misleading, e.g., touch/copy)
@@ -921,18 +1165,20 @@ class Indexer:
                         files_skipped_hash += 1
                         continue
                 
-                # File is new or modified - index it
-                count = await self.index_file(md_file, table_name, mtime=current_mtime)
-                total_indexed += count
-                
+                # File is new or modified - queue it for re-indexing
+                changed.append((md_file, current_mtime, file_path_str in indexed_files))
                 files_checked += 1
-                # Yield every 10 files to keep server responsive
-                if files_checked % 10 == 0:
-                    await asyncio.sleep(0)
+                if len(changed) >= DELETE_WINDOW:
+                    total_indexed += await self._reindex_changed(table, table_name, changed, self.index_file)
+                    changed = []
+            
+            if changed and not self._cancel_requested:
+                total_indexed += await self._reindex_changed(table, table_name, changed, self.index_file)
             
             # === PDF CHANGE DETECTION ===
             pdf_checked = 0
             pdf_skipped = 0
+            changed = []
             
             for pdf_file in pdf_files:
                 if self._cancel_requested:
@@ -954,13 +1200,15 @@ class Indexer:
                         pdf_skipped += 1
                         continue
                 
-                # PDF is new or modified - index it
-                count = await self.index_pdf_file(pdf_file, table_name, mtime=current_mtime)
-                total_indexed += count
-                
+                # PDF is new or modified - queue it for re-indexing
+                changed.append((pdf_file, current_mtime, file_path_str in indexed_files))
                 pdf_checked += 1
-                if pdf_checked % 5 == 0:
-                    await asyncio.sleep(0)
+                if len(changed) >= DELETE_WINDOW:
+                    total_indexed += await self._reindex_changed(table, table_name, changed, self.index_pdf_file)
+                    changed = []
+            
+            if changed and not self._cancel_requested:
+                total_indexed += await self._reindex_changed(table, table_name, changed, self.index_pdf_file)
             
             logger.info(
                 f"{table_name}: md_indexed={files_checked}, md_skipped(mtime)={files_skipped_mtime}, "
@@ -19,7 +19,7 @@ from datetime import datetime
 import lancedb
 import httpx
 
-from indexer import Indexer
+from indexer import Indexer, _executor as indexer_executor
 from searcher import Searcher
 from config import settings
 
@@ -60,6 +60,7 @@ db: lancedb.DBConnection = None
 indexer: Indexer = None
 searcher: Searcher = None
 fts_index = None
+embedding_cache = None
 
 # ============== Custom Prometheus Metrics ==============
 
@@ -154,7 +155,7 @@ API_INFO = Info('recall_api', 'API version and build info')
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize services on startup."""
-    global db, indexer, searcher, fts_index
+    global db, indexer, searcher, fts_index, embedding_cache
     
     logger.info("Starting Recall API...")
     
@@ -173,8 +174,16 @@ async def lifespan(app: FastAPI):
         logger.warning(f"FTS index unavailable: {e}. Hybrid search will fall back to vector-only.")
         fts_index = None
     
+    # Persistent embedding cache (optional - falls back to in-memory only)
+    from embedding_cache import EmbeddingCache
+    try:
+        embedding_cache = EmbeddingCache(os.path.join(settings.lancedb_path, "embedding_cache.db"))
+    except Exception as e:
+        logger.warning(f"Embedding cache unavailable: {e}. Embeddings will only be cached in memory.")
+        embedding_cache = None
+    
     # Initialize indexer and searcher with FTS index
-    indexer = Indexer(db, settings, fts_index=fts_index)
+    indexer = Indexer(db, settings, fts_index=fts_index, persistent_cache=embedding_cache)
     searcher = Searcher(db, settings, fts_index=fts_index)
     
     # Initialize tables if needed
@@ -185,8 +194,14 @@ async def lifespan(app: FastAPI):
     yield
     
     logger.info("Shutting down Recall API...")
+    await indexer.aclose()
+    # Drop queued hashing/chunking work instead of draining it at interpreter exit
+    indexer_executor.shutdown(wait=False, cancel_futures=True)
+    await searcher.aclose()
     if fts_index:
         fts_index.close()
+    if embedding_cache:
+        embedding_cache.close()
 
 
 app = FastAPI(
@@ -530,6 +545,7 @@ async def run_indexing(request: IndexRequest):
         indexed = await indexer.full_reindex(vault=request.vault)
     else:
         indexed = await indexer.incremental_index(vault=request.vault)
+    searcher.invalidate_tables()
     
     duration_ms = int((time.time() - start) * 1000)
     
@@ -608,6 +624,7 @@ async def _run_indexing_job(job_id: str, full: bool, vault: str, callback_url: O
             indexed = await indexer.full_reindex(vault=vault, progress_callback=progress_callback)
         else:
             indexed = await indexer.incremental_index(vault=vault, progress_callback=progress_callback)
+        searcher.invalidate_tables()
         
         duration_ms = int((time.time() - start) * 1000)
         
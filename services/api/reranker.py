@@ -4,13 +4,29 @@ Reranker - LLM-based reranking for search results
 Uses Ollama to score document relevance with a fast, small model.
 """
 
+import re
+import time
 import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Optional
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
 import httpx
 
+from text_utils import truncate_utf8
+
 logger = logging.getLogger(__name__)
 
+# Max UTF-8 bytes of each document shown to the judge model
+RERANK_MAX_BYTES = 2000
+
+# LRU capacities for LLM results reused across requests
+SCORE_CACHE_SIZE = 10_000
+EXPAND_CACHE_SIZE = 1_000
+
+# Lifetime (seconds) of a cached query expansion; expansions are sampled, so they expire
+EXPAND_CACHE_TTL = 300.0
+
 # Prompt for relevance scoring
 RERANK_PROMPT = """You are a relevance judge. Given a query and a document, determine if the document is relevant.
 
@@ -21,6 +37,19 @@ Document:
 
 Is this document relevant to the query? Answer with only YES or NO."""
 
+# Prompt for scoring several documents in one call
+RERANK_BATCH_PROMPT = """You are a relevance judge. Given a query and {count} numbered documents, determine for each document if it is relevant.
+
+Query: {query}
+
+Documents:
+{documents}
+
+Answer with exactly {count} lines, one per document, each in the form "N: YES" or "N: NO"."""
+
+# One "N: YES" / "N: NO" answer line of a batch response
+RERANK_ANSWER_RE = re.compile(r'^\W*(\d+)\W+(YES|NO)\b', re.IGNORECASE | re.MULTILINE)
+
 # Prompt for query expansion
 QUERY_EXPANSION_PROMPT = """Generate 2 alternative search queries for: "{query}"
 
@@ -40,34 +69,77 @@ class Reranker:
         self,
         ollama_url: str = "http://localhost:11434",
         model: str = "qwen2.5:0.5b",  # Fast, small model
-        timeout: float = 10.0
+        timeout: float = 10.0,
+        num_ctx: int = 8192  # Room for a batch of documents; same for every call so the model isn't reloaded
     ):
         self.ollama_url = ollama_url
         self.model = model
         self.timeout = timeout
+        self.num_ctx = num_ctx
+        # LRU caches: (query, document) digest -> score, query -> (expiry, expansions)
+        self._score_cache: OrderedDict[bytes, float] = OrderedDict()
+        self._expand_cache: OrderedDict[str, Tuple[float, List[str]]] = OrderedDict()
+        # Shared keep-alive client, reused by every rerank/expansion call
+        self._client = httpx.AsyncClient(
+            base_url=ollama_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_keepalive_connections=40, max_connections=100, keepalive_expiry=30)
+        )
     
-    async def _generate(self, prompt: str) -> str:
-        """Call Ollama generate API."""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{self.ollama_url}/api/generate",
-                    json={
-                        "model": self.model,
-                        "prompt": prompt,
-                        "stream": False,
-                        "options": {
-                            "temperature": 0.0,
-                            "num_predict": 10  # Short response
-                        }
-                    },
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                return response.json().get("response", "").strip()
-            except Exception as e:
-                logger.error(f"Ollama generate error: {e}")
-                return ""
+    async def aclose(self):
+        """Close the shared HTTP client (call on shutdown)."""
+        await self._client.aclose()
+    
+    async def _generate(self, prompt: str, num_predict: int = 1) -> str:
+        """
+        Call Ollama generate API for relevance verdicts.
+        
+        The default (one token, stop at newline) is a single YES/NO answer;
+        batch prompts pass a larger num_predict and read multiple lines.
+        """
+        options = {
+            "temperature": 0.0,
+            "num_predict": num_predict,
+            "num_ctx": self.num_ctx
+        }
+        if num_predict == 1:
+            options["stop"] = ["\n"]  # YES/NO is decided by the first token
+        
+        try:
+            response = await self._client.post(
+                "/api/generate",
+                json={
+                    "model": self.model,
+                    "prompt": prompt,
+                    "stream": False,
+                    "options": options
+                }
+            )
+            response.raise_for_status()
+            return response.json().get("response", "").strip()
+        except Exception as e:
+            logger.error(f"Ollama generate error: {e}")
+            return ""
+    
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key):
+        """LRU lookup; returns None on a miss."""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+    
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key, value, capacity: int):
+        """LRU insert, evicting the least recently used entry when full."""
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > capacity:
+            cache.popitem(last=False)
+    
+    @staticmethod
+    def _score_key(query: str, doc_text: str) -> bytes:
+        return hashlib.blake2b(query.encode() + b"\0" + doc_text.encode(), digest_size=16).digest()
     
     async def score_document(self, query: str, document: str) -> float:
         """
@@ -76,21 +148,84 @@ class Reranker:
         Returns 1.0 for relevant, 0.0 for not relevant.
         """
         # Truncate document to avoid context overflow
-        doc_text = document[:2000]
+        doc_text = truncate_utf8(document, RERANK_MAX_BYTES)
+        
+        key = self._score_key(query, doc_text)
+        cached = self._cache_get(self._score_cache, key)
+        if cached is not None:
+            return cached
         
         prompt = RERANK_PROMPT.format(query=query, document=doc_text)
         response = await self._generate(prompt)
         
-        # Parse YES/NO response
-        response_upper = response.upper().strip()
-        if response_upper.startswith("YES"):
-            return 1.0
-        elif response_upper.startswith("NO"):
-            return 0.0
+        # Parse YES/NO from the single generated token
+        answer = response.strip().upper()
+        if answer in ("YES", "Y"):
+            score = 1.0
+        elif answer in ("NO", "N"):
+            score = 0.0
         else:
-            # Ambiguous response, give partial score
+            # Empty (error) or unexpected token, give partial score (not cached)
             logger.debug(f"Ambiguous rerank response: {response}")
             return 0.5
+        
+        self._cache_put(self._score_cache, key, score, SCORE_CACHE_SIZE)
+        return score
+    
+    async def score_documents(
+        self,
+        query: str,
+        documents: List[str],
+        max_bytes: int = RERANK_MAX_BYTES
+    ) -> List[float]:
+        """
+        Score several documents' relevance to query with one LLM call.
+        
+        Cached scores are reused; only uncached documents go into the prompt.
+        If the call fails or returns no answer lines, those documents get a
+        neutral 0.5 (not cached). Documents missing from a partial answer are
+        re-scored one at a time with score_document, so a batch never issues
+        more than one request at once.
+        """
+        # Truncate each document to avoid context overflow (max_bytes <= RERANK_MAX_BYTES)
+        doc_texts = [truncate_utf8(doc, max_bytes) for doc in documents]
+        keys = [self._score_key(query, text) for text in doc_texts]
+        scores: List[Optional[float]] = [self._cache_get(self._score_cache, key) for key in keys]
+        
+        uncached = [i for i, score in enumerate(scores) if score is None]
+        if len(uncached) == 1:
+            scores[uncached[0]] = await self.score_document(query, doc_texts[uncached[0]])
+            return scores
+        if not uncached:
+            return scores
+        
+        count = len(uncached)
+        numbered = "\n\n".join(f"{n}) {doc_texts[i]}" for n, i in enumerate(uncached, start=1))
+        prompt = RERANK_BATCH_PROMPT.format(query=query, count=count, documents=numbered)
+        # "N: YES" plus newline is ~4 tokens per document
+        response = await self._generate(prompt, num_predict=4 * count + 4)
+        
+        answered = False
+        for match in RERANK_ANSWER_RE.finditer(response):
+            answered = True
+            n = int(match.group(1)) - 1
+            if 0 <= n < count and scores[uncached[n]] is None:
+                i = uncached[n]
+                scores[i] = 1.0 if match.group(2).upper() == "YES" else 0.0
+                self._cache_put(self._score_cache, keys[i], scores[i], SCORE_CACHE_SIZE)
+        
+        missing = [i for i in uncached if scores[i] is None]
+        if missing and not answered:
+            # Failed or unparseable call: don't multiply the load on Ollama with retries
+            logger.debug(f"Batch rerank returned no answers for {count} documents: {response!r}")
+            for i in missing:
+                scores[i] = 0.5
+        elif missing:
+            logger.debug(f"Batch rerank response missing {len(missing)}/{count} answers, scoring singly")
+            for i in missing:
+                scores[i] = await self.score_document(query, doc_texts[i])
+        
+        return scores
     
     async def rerank(
         self,
@@ -99,7 +234,9 @@ class Reranker:
         content_key: str = "content",
         id_key: str = "file_path",
         top_k: int = 30,
-        concurrency: int = 5
+        concurrency: int = 5,
+        batch_size: int = 5,
+        max_bytes: int = RERANK_MAX_BYTES
     ) -> Dict[str, float]:
         """
         Rerank documents by relevance to query.
@@ -111,6 +248,8 @@ class Reranker:
             id_key: Key for document ID
             top_k: Number of docs to rerank
             concurrency: Max concurrent LLM calls
+            batch_size: Documents judged per LLM call
+            max_bytes: UTF-8 bytes of each document shown to the model
         
         Returns:
             Dict mapping doc_id to relevance score (0-1)
@@ -120,20 +259,24 @@ class Reranker:
         # Semaphore for concurrency control
         sem = asyncio.Semaphore(concurrency)
         
-        async def score_with_semaphore(doc: Dict) -> tuple:
+        async def score_with_semaphore(group: List[Dict]) -> List[tuple]:
             async with sem:
-                doc_id = doc.get(id_key, "")
-                content = doc.get(content_key, "")
-                
-                if not content:
-                    # Try 'snippet' as fallback
-                    content = doc.get("snippet", doc.get("excerpt", ""))
+                contents = []
+                for doc in group:
+                    content = doc.get(content_key, "")
+                    if not content:
+                        # Try 'snippet' as fallback
+                        content = doc.get("snippet", doc.get("excerpt", ""))
+                    contents.append(content)
                 
-                score = await self.score_document(query, content)
-                return (doc_id, score)
+                group_scores = await self.score_documents(query, contents, max_bytes)
+                return [(doc.get(id_key, ""), score) for doc, score in zip(group, group_scores)]
         
-        # Score all documents concurrently
-        tasks = [score_with_semaphore(doc) for doc in docs_to_rerank]
+        # Score groups of documents concurrently
+        tasks = [
+            score_with_semaphore(docs_to_rerank[start:start + batch_size])
+            for start in range(0, len(docs_to_rerank), batch_size)
+        ]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Build score dict, handling errors
@@ -142,8 +285,8 @@ class Reranker:
             if isinstance(result, Exception):
                 logger.error(f"Rerank error: {result}")
                 continue
-            doc_id, score = result
-            scores[doc_id] = score
+            for doc_id, score in result:
+                scores[doc_id] = score
         
         return scores
     
@@ -152,59 +295,66 @@ class Reranker:
         Generate alternative query formulations.
         
         Returns list of queries: [original, alternative1, alternative2]
+        
+        Expansions are sampled (temperature 0.7), so a cached one is reused
+        for only EXPAND_CACHE_TTL seconds: repeated queries skip the LLM call
+        for a while but still get fresh alternatives over time.
         """
+        cached = self._cache_get(self._expand_cache, query)
+        if cached is not None:
+            if cached[0] >= time.monotonic():
+                return list(cached[1])
+            del self._expand_cache[query]
+        
         prompt = QUERY_EXPANSION_PROMPT.format(query=query)
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{self.ollama_url}/api/generate",
-                    json={
-                        "model": self.model,
-                        "prompt": prompt,
-                        "stream": False,
-                        "options": {
-                            "temperature": 0.7,  # Some creativity
-                            "num_predict": 50
-                        }
-                    },
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                result = response.json().get("response", "").strip()
-                
-                # Parse response lines
-                lines = [line.strip() for line in result.split("\n") if line.strip()]
-                # Clean up numbered prefixes like "1." or "1:"
-                alternatives = []
-                for line in lines[:2]:
-                    # Remove common prefixes
-                    for prefix in ["1.", "2.", "1:", "2:", "1)", "2)", "-", "•"]:
-                        if line.startswith(prefix):
-                            line = line[len(prefix):].strip()
-                    if line and line != query:
-                        alternatives.append(line)
-                
-                return [query] + alternatives
-                
-            except Exception as e:
-                logger.error(f"Query expansion error: {e}")
-                return [query]  # Fallback to original only
+        try:
+            response = await self._client.post(
+                "/api/generate",
+                json={
+                    "model": self.model,
+                    "prompt": prompt,
+                    "stream": False,
+                    "options": {
+                        "temperature": 0.7,  # Some creativity
+                        "num_predict": 50,
+                        "num_ctx": self.num_ctx
+                    }
+                }
+            )
+            response.raise_for_status()
+            result = response.json().get("response", "").strip()
+            
+            # Parse response lines
+            lines = [line.strip() for line in result.split("\n") if line.strip()]
+            # Clean up numbered prefixes like "1." or "1:"
+            alternatives = []
+            for line in lines[:2]:
+                # Remove common prefixes
+                for prefix in ["1.", "2.", "1:", "2:", "1)", "2)", "-", "•"]:
+                    if line.startswith(prefix):
+                        line = line[len(prefix):].strip()
+                if line and line != query:
+                    alternatives.append(line)
+            
+            expanded = [query] + alternatives
+            self._cache_put(self._expand_cache, query, (time.monotonic() + EXPAND_CACHE_TTL, expanded), EXPAND_CACHE_SIZE)
+            return list(expanded)
+            
+        except Exception as e:
+            logger.error(f"Query expansion error: {e}")
+            return [query]  # Fallback to original only
     
     async def check_model(self) -> bool:
         """Check if the reranker model is available."""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.ollama_url}/api/tags",
-                    timeout=5.0
-                )
-                response.raise_for_status()
-                models = response.json().get("models", [])
-                model_names = [m.get("name", "").split(":")[0] for m in models]
-                
-                target = self.model.split(":")[0]
-                return target in model_names
-            except Exception as e:
-                logger.error(f"Model check error: {e}")
-                return False
+        try:
+            response = await self._client.get("/api/tags", timeout=5.0)
+            response.raise_for_status()
+            models = response.json().get("models", [])
+            model_names = [m.get("name", "").split(":")[0] for m in models]
+            
+            target = self.model.split(":")[0]
+            return target in model_names
+        except Exception as e:
+            logger.error(f"Model check error: {e}")
+            return False
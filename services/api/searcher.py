@@ -9,12 +9,28 @@ v4: Added temporal expression parsing for date-aware search
 
 import os
 import re
+import time
+import heapq
+import asyncio
 import logging
-from typing import List, Dict, Optional, Tuple, Set
+from functools import lru_cache
+from collections import OrderedDict
+from itertools import chain, islice
+from operator import itemgetter
+from typing import List, Dict, Optional, Tuple, Set, Union
 from pathlib import Path
 
 import httpx
 import lancedb
+import numpy as np
+
+# Faster JSON decoding of Ollama/gateway responses (optional, falls back to httpx's json)
+try:
+    import orjson
+    ORJSON_ENABLED = True
+except ImportError:
+    ORJSON_ENABLED = False
+    orjson = None
 
 from config import Settings
 from fusion import reciprocal_rank_fusion, position_aware_blend, normalize_scores
@@ -24,6 +40,25 @@ from temporal import parse_temporal_expression, extract_query_without_temporal,
 
 logger = logging.getLogger(__name__)
 
+# LanceDB tables searched for each vault filter
+VAULT_TABLES = {
+    "all": ("work", "personal"),
+    "work": ("work",),
+    "personal": ("personal",),
+}
+
+# UTF-8 bytes of each document shown to the reranker in query_search
+QUERY_RERANK_MAX_BYTES = 1000
+
+# Query embedding cache: LRU capacity and entry lifetime (seconds)
+EMBED_CACHE_SIZE = 4096
+EMBED_CACHE_TTL = 3600.0
+
+# Hedged embedding requests: each request earns HEDGE_BUDGET of a hedge (so at most
+# ~5% of requests are duplicated), with up to HEDGE_BURST hedges saved up
+HEDGE_BUDGET = 0.05
+HEDGE_BURST = 5.0
+
 
 # Common words to exclude from name detection
 COMMON_WORDS = {
@@ -54,6 +89,12 @@ COMMON_WORDS = {
     'highlights', 'summary', 'overview', 'report', 'analysis',
 }
 
+# A bulleted line ("-", "•" or "*"), minus surrounding whitespace
+BULLET_LINE_RE = re.compile(r'^\s*([-•*].*?)\s*$', re.MULTILINE)
+
+# Words that mark a bullet as an action item (matched anywhere, like a substring test)
+ACTION_WORDS_RE = re.compile(r'will|to do|action|next|follow', re.IGNORECASE)
+
 
 def detect_names(query: str) -> Set[str]:
     """
@@ -88,6 +129,41 @@ def detect_names(query: str) -> Set[str]:
     return names
 
 
+def _json_body(response: httpx.Response):
+    """Decode a JSON response body (orjson when available)."""
+    if ORJSON_ENABLED:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _sql_str(value: str) -> str:
+    """Quote a string literal for a LanceDB filter (embedded quotes doubled)."""
+    return '"' + value.replace('"', '""') + '"'
+
+
+@lru_cache(maxsize=256)
+def build_where(
+    category: Optional[str],
+    person: Optional[str],
+    date_from: Optional[str],
+    date_to: Optional[str],
+    exclusion_filter: str = ""
+) -> Optional[str]:
+    """Build (and memoize) the LanceDB WHERE clause for a filter combination."""
+    filters = []
+    if category:
+        filters.append(f'category = {_sql_str(category)}')
+    if person:
+        filters.append(f'array_contains(people, {_sql_str(person)})')
+    if date_from:
+        filters.append(f'date >= {_sql_str(date_from)}')
+    if date_to:
+        filters.append(f'date <= {_sql_str(date_to)}')
+    if exclusion_filter:
+        filters.append(exclusion_filter)
+    return " AND ".join(filters) if filters else None
+
+
 def has_person_query_intent(query: str) -> bool:
     """
     Detect if query is looking for information about a specific person.
@@ -141,21 +217,209 @@ class Searcher:
             ollama_url=settings.ollama_url,
             model="qwen2.5:0.5b"  # Fast model for reranking
         )
+        
+        # Shared keep-alive clients: Ollama (query embeddings) and the Clawdbot gateway (RAG answers)
+        self._client = httpx.AsyncClient(
+            base_url=settings.ollama_url,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        )
+        self._llm_client = httpx.AsyncClient(timeout=60.0)
+        
+        # Excluded folders are filtered inside LanceDB/FTS so they never take up result slots
+        # (vector queries prefilter whenever an exclusion clause is present).
+        # NOT LIKE wildcards can only exclude more, never less, than a substring test.
+        self._excluded_folders = settings.excluded_folders_list
+        self._exclusion_filter = " AND ".join(
+            f'file_path NOT LIKE {_sql_str("%" + folder + "%")}' for folder in self._excluded_folders
+        )
+        
+        self._hedge_tokens = HEDGE_BURST
+        
+        # Opened LanceDB table handles, by name (opened lazily: tables may not exist yet)
+        self._tables = {}
+        
+        # LRU of (model, text) -> (expiry, read-only embedding)
+        self._embedding_cache: OrderedDict[Tuple[str, str], Tuple[float, np.ndarray]] = OrderedDict()
     
-    async def get_embedding(self, text: str) -> List[float]:
-        """Get embedding from Ollama."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.settings.ollama_url}/api/embed",
-                json={
-                    "model": self.settings.embedding_model,
-                    "input": text
-                },
-                timeout=30.0
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["embeddings"][0]
+    async def aclose(self):
+        """Close the shared HTTP clients, including the reranker's (call on shutdown)."""
+        await self._client.aclose()
+        await self._llm_client.aclose()
+        await self.reranker.aclose()
+    
+    def clear_embedding_cache(self):
+        """Drop all cached query embeddings."""
+        self._embedding_cache.clear()
+    
+    def _cached_embedding(self, text: str) -> Optional[np.ndarray]:
+        """LRU/TTL lookup; returns None on a miss or an expired entry."""
+        key = (self.settings.embedding_model, text)
+        entry = self._embedding_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._embedding_cache[key]
+            return None
+        self._embedding_cache.move_to_end(key)
+        return entry[1]
+    
+    def _cache_embedding(self, text: str, embedding: np.ndarray):
+        """LRU insert, evicting the least recently used entry when full."""
+        embedding.flags.writeable = False  # Shared between requests
+        key = (self.settings.embedding_model, text)
+        self._embedding_cache[key] = (time.monotonic() + EMBED_CACHE_TTL, embedding)
+        self._embedding_cache.move_to_end(key)
+        if len(self._embedding_cache) > EMBED_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+    
+    async def _embed_request(self, texts: Union[str, List[str]]) -> Dict:
+        """POST one /api/embed request and decode the response."""
+        response = await self._client.post(
+            "/api/embed",
+            json={
+                "model": self.settings.embedding_model,
+                "input": texts
+            }
+        )
+        response.raise_for_status()
+        return _json_body(response)
+    
+    async def _embed(self, texts: Union[str, List[str]]) -> Dict:
+        """
+        Embed with a hedged request.
+        
+        If Ollama hasn't answered after settings.embedding_hedge_delay, a
+        duplicate request is raced against the first (within the hedge budget)
+        and the first successful response wins.
+        """
+        delay = self.settings.embedding_hedge_delay
+        if delay <= 0:
+            return await self._embed_request(texts)
+        
+        self._hedge_tokens = min(HEDGE_BURST, self._hedge_tokens + HEDGE_BUDGET)
+        first = asyncio.create_task(self._embed_request(texts))
+        pending = {first}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done or self._hedge_tokens < 1.0:
+                return await first
+            
+            self._hedge_tokens -= 1.0
+            logger.debug(f"Embedding request slower than {delay}s, hedging")
+            pending.add(asyncio.create_task(self._embed_request(texts)))
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                if not pending:
+                    return done.pop().result()  # Both failed; raise the last error
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    async def get_embedding(self, text: str) -> np.ndarray:
+        """Get embedding from Ollama as a float32 vector (passed to LanceDB as-is)."""
+        cached = self._cached_embedding(text)
+        if cached is not None:
+            return cached
+        
+        data = await self._embed(text)
+        embedding = np.asarray(data["embeddings"][0], dtype=np.float32)
+        self._cache_embedding(text, embedding)
+        return embedding
+    
+    async def get_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Get float32 embeddings for several texts, in order.
+        
+        Cached texts are served from memory; the rest go to Ollama in one request.
+        """
+        embeddings: List[Optional[np.ndarray]] = [self._cached_embedding(text) for text in texts]
+        missing = list(dict.fromkeys(text for text, emb in zip(texts, embeddings) if emb is None))
+        if not missing:
+            return embeddings
+        
+        data = await self._embed(missing)
+        fetched = data["embeddings"]
+        if len(fetched) != len(missing):
+            raise ValueError(f"Expected {len(missing)} embeddings, got {len(fetched)}")
+        
+        by_text = {}
+        for text, vector in zip(missing, np.asarray(fetched, dtype=np.float32)):
+            self._cache_embedding(text, vector)
+            by_text[text] = vector
+        return [emb if emb is not None else by_text[text] for text, emb in zip(texts, embeddings)]
+    
+    @staticmethod
+    def _split_temporal(query: str) -> Tuple[str, Optional[DateRange]]:
+        """Parse a temporal expression out of query; returns (query without it, date range)."""
+        date_range = parse_temporal_expression(query)
+        if date_range:
+            return extract_query_without_temporal(query, date_range), date_range
+        return query, None
+    
+    def invalidate_tables(self):
+        """Drop cached table handles so the next search reopens them (call after indexing)."""
+        self._tables.clear()
+    
+    def _open_table(self, table_name: str):
+        """Return the cached handle for table_name, opening it on first use."""
+        table = self._tables.get(table_name)
+        if table is None:
+            table = self._tables[table_name] = self.db.open_table(table_name)
+        return table
+    
+    @staticmethod
+    def _query_table(table, query_embedding: np.ndarray, where: Optional[str], limit: int, prefilter: bool = False):
+        """Run the vector query on an opened table; returns the hits as an Arrow table.
+        
+        LanceDB applies where() after the nearest-neighbour search unless
+        prefilter is set, so filtered-out rows still use up the limit.
+        """
+        search = table.search(query_embedding)
+        if where:
+            search = search.where(where, prefilter=prefilter)
+        return search.limit(limit).to_arrow()
+    
+    def _search_table(self, table_name: str, query_embedding: np.ndarray, where: Optional[str], limit: int) -> List[Dict]:
+        """Vector search one table. (Blocking, runs in a worker thread)"""
+        prefilter = bool(self._exclusion_filter)
+        try:
+            hits = self._query_table(self._open_table(table_name), query_embedding, where, limit, prefilter)
+        except Exception:
+            # The cached handle may be stale (a full reindex drops and recreates tables); reopen once
+            self._tables.pop(table_name, None)
+            hits = self._query_table(self._open_table(table_name), query_embedding, where, limit, prefilter)
+        
+        # Convert distances to similarity scores (1 / (1 + distance)) in one pass
+        distances = hits.column("_distance").to_numpy(zero_copy_only=False).astype(np.float64)
+        scores = (1.0 / (1.0 + distances)).tolist()
+        
+        results = []
+        for score, file_path, title, content, date, people, category in zip(
+            scores,
+            hits.column("file_path").to_pylist(),
+            hits.column("title").to_pylist(),
+            hits.column("content").to_pylist(),
+            hits.column("date").to_pylist(),
+            hits.column("people").to_pylist(),
+            hits.column("category").to_pylist()
+        ):
+            results.append({
+                "score": score,
+                "file_path": file_path,
+                "title": title,
+                "content": content,
+                "excerpt": content[:300] + "..." if len(content) > 300 else content,
+                "date": date,
+                "people": people,
+                "category": category,
+                "vault": table_name,
+                "source": "vector"
+            })
+        return results
     
     async def vector_search(
         self,
@@ -165,67 +429,34 @@ class Searcher:
         person: Optional[str] = None,
         limit: int = 30,
         date_from: Optional[str] = None,
-        date_to: Optional[str] = None
+        date_to: Optional[str] = None,
+        query_embedding: Optional[np.ndarray] = None
     ) -> List[Dict]:
-        """Pure vector search using LanceDB."""
+        """Pure vector search using LanceDB (query_embedding skips embedding the query)."""
         
-        query_embedding = await self.get_embedding(query)
+        if query_embedding is None:
+            query_embedding = await self.get_embedding(query)
         
-        results = []
+        tables_to_search = VAULT_TABLES.get(vault, ())
         
-        tables_to_search = []
-        if vault in ["all", "work"]:
-            tables_to_search.append("work")
-        if vault in ["all", "personal"]:
-            tables_to_search.append("personal")
+        where = build_where(category, person, date_from, date_to, self._exclusion_filter)
         
-        for table_name in tables_to_search:
-            try:
-                table = self.db.open_table(table_name)
-                
-                search = table.search(query_embedding)
-                
-                filters = []
-                if category:
-                    filters.append(f'category = "{category}"')
-                if person:
-                    filters.append(f'array_contains(people, "{person}")')
-                if date_from:
-                    filters.append(f'date >= "{date_from}"')
-                if date_to:
-                    filters.append(f'date <= "{date_to}"')
-                
-                if filters:
-                    search = search.where(" AND ".join(filters))
-                
-                search_results = search.limit(limit).to_list()
-                
-                for r in search_results:
-                    content = r.get("content", "")
-                    excerpt = content[:300] + "..." if len(content) > 300 else content
-                    
-                    # Convert distance to similarity score (1 / (1 + distance))
-                    distance = float(r.get("_distance", 0))
-                    score = 1.0 / (1.0 + distance)
-                    
-                    results.append({
-                        "score": score,
-                        "file_path": r.get("file_path", ""),
-                        "title": r.get("title", ""),
-                        "content": content,
-                        "excerpt": excerpt,
-                        "date": r.get("date"),
-                        "people": r.get("people", []),
-                        "category": r.get("category", ""),
-                        "vault": table_name,
-                        "source": "vector"
-                    })
-            
-            except Exception as e:
-                logger.error(f"Error searching {table_name}: {e}")
+        # Search the tables in parallel on worker threads (LanceDB calls block)
+        per_table = await asyncio.gather(
+            *(asyncio.to_thread(self._search_table, table_name, query_embedding, where, limit)
+              for table_name in tables_to_search),
+            return_exceptions=True
+        )
         
-        results.sort(key=lambda x: x["score"], reverse=True)
-        return results[:limit]
+        ranked = []
+        for table_name, table_results in zip(tables_to_search, per_table):
+            if isinstance(table_results, Exception):
+                logger.error(f"Error searching {table_name}: {table_results}")
+                continue
+            ranked.append(table_results)
+        
+        # Each table's hits come back nearest-first, so merge instead of re-sorting
+        return list(islice(heapq.merge(*ranked, key=itemgetter("score"), reverse=True), limit))
     
     async def bm25_search(
         self,
@@ -246,7 +477,8 @@ class Searcher:
             limit=limit,
             person=person,
             date_from=date_from,
-            date_to=date_to
+            date_to=date_to,
+            exclude_paths=self._excluded_folders
         )
     
     async def hybrid_search(
@@ -257,7 +489,8 @@ class Searcher:
         person: Optional[str] = None,
         limit: int = 10,
         date_from: Optional[str] = None,
-        date_to: Optional[str] = None
+        date_to: Optional[str] = None,
+        query_embedding: Optional[np.ndarray] = None
     ) -> List[Dict]:
         """
         Hybrid search combining BM25 + Vector using RRF fusion.
@@ -270,20 +503,17 @@ class Searcher:
         
         Temporal awareness: If query contains temporal expressions like "this week"
         or "last month", automatically filters results to that date range.
-        """
-        import asyncio
         
-        # Parse temporal expressions from query
-        date_range = parse_temporal_expression(query)
+        query_embedding, if given, must be the embedding of the query with
+        its temporal expression removed (see _split_temporal).
+        """
+        # Parse temporal expressions from query; the cleaned query gives better semantic search
+        search_query, date_range = self._split_temporal(query)
         if date_range:
             # Use parsed date range
             date_from = date_range.start
             date_to = date_range.end
-            # Clean query to remove temporal expression for better semantic search
-            search_query = extract_query_without_temporal(query, date_range)
             logger.info(f"Temporal query detected: {date_range}, cleaned query: '{search_query}'")
-        else:
-            search_query = query
         
         # Detect if this is a person-focused query
         detected_names = detect_names(search_query)
@@ -299,24 +529,24 @@ class Searcher:
         
         # Run BM25 and vector search in parallel
         bm25_task = self.bm25_search(bm25_query, vault, person, limit=30, date_from=date_from, date_to=date_to)
-        vector_task = self.vector_search(search_query, vault, category, person, limit=30, date_from=date_from, date_to=date_to)
+        vector_task = self.vector_search(search_query, vault, category, person, limit=30, date_from=date_from, date_to=date_to,
+                                         query_embedding=query_embedding)
         
         bm25_results, vector_results = await asyncio.gather(bm25_task, vector_task)
         
         logger.info(f"Hybrid search: BM25={len(bm25_results)}, Vector={len(vector_results)}, person_query={is_person_query}")
         
-        # Build result lists for RRF fusion
-        # For person queries, add BM25 results multiple times to boost weight
+        # RRF weights: for person queries, boost BM25
         if is_person_query and len(bm25_results) > 0:
             # 3:1 BM25 to Vector ratio for name queries
-            result_lists = [bm25_results, bm25_results, bm25_results, vector_results]
+            weights = [3.0, 1.0]
             logger.info("Using 3:1 BM25 boost for person query")
         else:
             # Standard 1:1 ratio
-            result_lists = [bm25_results, vector_results]
+            weights = [1.0, 1.0]
         
         # Fuse results using RRF
-        fused = reciprocal_rank_fusion(result_lists, k=60)
+        fused = reciprocal_rank_fusion([bm25_results, vector_results], k=60, max_rank=30, weights=weights)
         
         # Normalize scores to 0-1
         fused = normalize_scores(fused)
@@ -338,8 +568,6 @@ class Searcher:
         
         This is the highest quality search but also slowest.
         """
-        import asyncio
-        
         # Step 1: Query expansion
         if use_query_expansion:
             queries = await self.reranker.expand_query(query)
@@ -347,18 +575,24 @@ class Searcher:
         else:
             queries = [query]
         
-        # Step 2: Run hybrid search for each query
-        all_results = []
-        for q in queries:
-            results = await self.hybrid_search(q, vault, category, person, limit=30)
-            all_results.append(results)
+        # Step 2: Embed all queries in one Ollama call, then run their hybrid searches concurrently
+        embeddings = [None] * len(queries)
+        if len(queries) > 1:
+            try:
+                embeddings = await self.get_embeddings([self._split_temporal(q)[0] for q in queries])
+            except Exception as e:
+                logger.warning(f"Batch query embedding failed, embedding per query: {e}")
         
-        # Weight original query higher (add it twice)
-        if len(all_results) > 1:
-            all_results.insert(0, all_results[0])
+        all_results = list(await asyncio.gather(*(
+            self.hybrid_search(q, vault, category, person, limit=30, query_embedding=embedding)
+            for q, embedding in zip(queries, embeddings)
+        )))
+        
+        # Weight original query higher (counts twice)
+        weights = [2.0 if len(all_results) > 1 else 1.0] + [1.0] * (len(all_results) - 1)
         
         # Step 3: Fuse all query results
-        fused = reciprocal_rank_fusion(all_results, k=60)
+        fused = reciprocal_rank_fusion(all_results, k=60, max_rank=30, weights=weights)
         
         # Step 4: Reranking (optional, adds latency)
         if use_reranking and len(fused) > 0:
@@ -367,11 +601,12 @@ class Searcher:
                 query=query,
                 documents=fused[:30],
                 content_key="content",
-                concurrency=5
+                concurrency=5,
+                max_bytes=QUERY_RERANK_MAX_BYTES
             )
             
             # Blend RRF and reranker scores
-            fused = position_aware_blend(fused, rerank_scores)
+            fused = position_aware_blend(fused, rerank_scores, top_k=limit)
             logger.info(f"Reranked {len(rerank_scores)} documents")
         
         return fused[:limit]
@@ -408,21 +643,29 @@ class Searcher:
         else:  # hybrid (default)
             results = await self.hybrid_search(query, vault, category, person, limit, date_from, date_to)
         
-        # Format results for API response
-        formatted = []
-        for r in results:
-            formatted.append({
-                "score": r.get("score", 0),
-                "file_path": r.get("file_path", ""),
-                "title": r.get("title", ""),
-                "excerpt": r.get("excerpt", r.get("snippet", r.get("content", "")[:300])),
-                "date": r.get("date"),
-                "people": r.get("people", []),
-                "category": r.get("category", ""),
-                "vault": r.get("vault", "")
-            })
+        return self._format_results(results)
+    
+    @staticmethod
+    def _format_results(results: List[Dict]) -> List[Dict]:
+        """
+        Format results for API response.
         
-        return formatted
+        Vector and BM25 results (and the fused/blended copies of them) all
+        carry these keys, so they are read directly.
+        """
+        return [
+            {
+                "score": r["score"],
+                "file_path": r["file_path"],
+                "title": r["title"],
+                "excerpt": r["excerpt"],
+                "date": r["date"],
+                "people": r["people"],
+                "category": r["category"],
+                "vault": r["vault"]
+            }
+            for r in results
+        ]
     
     async def query_with_llm(
         self,
@@ -448,9 +691,6 @@ class Searcher:
         sources = []
         
         for i, result in enumerate(search_results):
-            if any(excl in result["file_path"] for excl in self.settings.excluded_folders_list):
-                continue
-            
             context_parts.append(f"[Source {i+1}: {result['title']} ({result['date'] or 'undated'})]")
             context_parts.append(result["excerpt"])
             context_parts.append("")
@@ -465,9 +705,6 @@ class Searcher:
         
         # Generate answer using Claude via Clawdbot gateway
         try:
-            import httpx
-            import os
-            
             clawdbot_url = os.getenv("CLAWDBOT_URL", "http://host.docker.internal:18789")
             clawdbot_token = os.getenv("CLAWDBOT_TOKEN")
             
@@ -480,21 +717,20 @@ Context:
 
 Please provide a concise, helpful answer based only on the information provided. If the context doesn't contain enough information to fully answer the question, say so."""
 
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{clawdbot_url}/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {clawdbot_token}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "clawdbot",
-                        "messages": [{"role": "user", "content": prompt}]
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
-                answer = data["choices"][0]["message"]["content"]
+            response = await self._llm_client.post(
+                f"{clawdbot_url}/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {clawdbot_token}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": "clawdbot",
+                    "messages": [{"role": "user", "content": prompt}]
+                }
+            )
+            response.raise_for_status()
+            data = _json_body(response)
+            answer = data["choices"][0]["message"]["content"]
         
         except Exception as e:
             logger.error(f"Error calling Clawdbot: {e}")
@@ -503,47 +739,53 @@ Please provide a concise, helpful answer based only on the information provided.
         return answer, sources
     
     async def get_person_context(self, person: str) -> Dict:
-        """Get context for 1:1 with a person."""
-        
-        results = await self.search(
-            query=person,
-            vault="work",
-            person=person,
-            limit=20,
-            mode="hybrid"
-        )
+        """
+        Get context for 1:1 with a person.
         
-        mention_results = await self.search(
-            query=f"meeting with {person}",
-            vault="work",
-            limit=10,
-            mode="hybrid"
-        )
+        The person's name (restricted to notes tagged with them) and
+        "meeting with <person>" are searched in one pass: both queries are
+        embedded in a single request and their BM25 and vector results are
+        fused with one RRF (which also dedupes by file). Each query keeps
+        hybrid_search's limit and 3:1 BM25 boost for person queries.
+        """
+        queries = [person, f"meeting with {person}"]
+        people_filters = [person, None]
+        limits = [20, 10]
         
-        all_results = results + mention_results
-        seen_files = set()
-        unique_results = []
-        for r in all_results:
-            if r["file_path"] not in seen_files:
-                seen_files.add(r["file_path"])
-                unique_results.append(r)
-        
-        topics = []
-        actions = []
-        dates = []
-        
-        for r in unique_results[:10]:
-            if r["date"]:
-                dates.append(r["date"])
-            
-            content = r.get("excerpt", "")
-            if person.lower() in content.lower():
-                action_match = re.findall(rf'{person}[:\s]+(.+?)(?:\n|$)', content, re.IGNORECASE)
-                actions.extend(action_match[:2])
-            
-            title = r.get("title", "")
-            if title and title not in topics:
-                topics.append(title)
+        try:
+            embeddings = await self.get_embeddings(queries)
+        except Exception as e:
+            logger.warning(f"Batch query embedding failed, embedding per query: {e}")
+            embeddings = [None] * len(queries)
+        
+        # Names-only BM25 queries avoid FTS phrase matching issues (as in hybrid_search)
+        bm25_queries = [" ".join(detect_names(q)) or q for q in queries]
+        
+        searches = []
+        for q, bm25_q, p, limit, embedding in zip(queries, bm25_queries, people_filters, limits, embeddings):
+            searches.append(self.bm25_search(bm25_q, "work", p, limit=limit))
+            searches.append(self.vector_search(q, "work", None, p, limit=limit, query_embedding=embedding))
+        result_lists = await asyncio.gather(*searches)  # [bm25, vector] per query
+        
+        weights = []
+        for q, bm25_results in zip(queries, result_lists[::2]):
+            is_person_query = has_person_query_intent(q) or len(detect_names(q)) > 0
+            weights.extend([3.0 if is_person_query and bm25_results else 1.0, 1.0])
+        
+        fused = reciprocal_rank_fusion(list(result_lists), k=60, max_rank=max(limits), weights=weights)
+        fused = normalize_scores(fused[:sum(limits)])
+        unique_results = self._format_results(fused)
+        
+        # Column views of the top results
+        top = unique_results[:10]
+        dates = [r["date"] for r in top if r["date"]]
+        titles = [r.get("title", "") for r in top]
+        excerpts = [r.get("excerpt", "") for r in top]
+        
+        # The pattern only matches where the person is mentioned, so it is also the mention filter
+        person_action_re = re.compile(rf'{re.escape(person)}[:\s]+(.+?)(?:\n|$)', re.IGNORECASE)
+        actions = list(chain.from_iterable(person_action_re.findall(content)[:2] for content in excerpts))
+        topics = list(dict.fromkeys(title for title in titles if title))
         
         recent_meetings = []
         for r in unique_results[:5]:
@@ -574,37 +816,24 @@ Please provide a concise, helpful answer based only on the information provided.
             mode="hybrid"
         )
         
-        actions = []
+        actions = {}  # item text -> action; first occurrence wins
+        # Person filter is a case-insensitive substring match
+        wanted_re = re.compile(re.escape(person), re.IGNORECASE) if person else ACTION_WORDS_RE
         
         for r in results:
             content = r.get("excerpt", "")
-            lines = content.split("\n")
-            for line in lines:
-                line = line.strip()
-                if line.startswith(("-", "•", "*")) and len(line) > 10:
-                    if person:
-                        if person.lower() in line.lower():
-                            actions.append({
-                                "item": line.lstrip("-•* "),
-                                "date": r["date"],
-                                "source": r["title"]
-                            })
-                    else:
-                        if any(word in line.lower() for word in ["will", "to do", "action", "next", "follow"]):
-                            actions.append({
-                                "item": line.lstrip("-•* "),
-                                "date": r["date"],
-                                "source": r["title"]
-                            })
-        
-        seen = set()
-        unique_actions = []
-        for a in actions:
-            if a["item"] not in seen:
-                seen.add(a["item"])
-                unique_actions.append(a)
-        
-        return unique_actions[:limit]
+            for match in BULLET_LINE_RE.finditer(content):
+                line = match.group(1)
+                if len(line) > 10 and wanted_re.search(line):
+                    item = line.lstrip("-•* ")
+                    if item not in actions:
+                        actions[item] = {
+                            "item": item,
+                            "date": r["date"],
+                            "source": r["title"]
+                        }
+        
+        return list(islice(actions.values(), limit))
     
     def index_document_fts(
         self,
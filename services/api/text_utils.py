@@ -0,0 +1,21 @@
+"""
+Text utilities shared by the indexer and reranker
+"""
+
+
+def truncate_utf8(text: str, limit: int) -> str:
+    """
+    Truncate text to at most `limit` UTF-8 bytes without splitting a character.
+    
+    Model inputs are tokenized from bytes, so a byte budget keeps multibyte
+    (e.g. CJK) content from sending up to 4x more data than intended.
+    """
+    if text.isascii():
+        return text[:limit]
+    if len(text) <= limit // 4:
+        return text
+    data = text.encode()
+    if len(data) <= limit:
+        return text
+    # A cut inside a multibyte sequence leaves an incomplete tail; drop it
+    return data[:limit].decode(errors="ignore")